@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import time
+from struct import Struct
 
 from .const import GOODWE_TCP_PORT, GOODWE_UDP_PORT
 from .dt import DT
@@ -11,7 +14,7 @@ from .et import ET
 from .exceptions import InverterError, RequestFailedException
 from .inverter import Inverter, OperationMode, Sensor, SensorKind
 from .model import DT_MODEL_TAGS, ES_MODEL_TAGS, ET_MODEL_TAGS
-from .protocol import ProtocolCommand, UdpInverterProtocol, Aa55ProtocolCommand
+from .protocol import BROADCAST_ADDRESS, ProtocolCommand, UdpInverterProtocol, Aa55ProtocolCommand
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,22 @@ DT_FAMILY = ["DT", "MS", "NS", "XS"]
 # Initial discovery command
 DISCOVERY_COMMAND = Aa55ProtocolCommand("010200", "0182")
 
+# Model name (offset 5) and serial number (offset 31) fields of the discovery command response
+_AA55_DEVICE_INFO = Struct("5x10s16x16s")
+
+# Model tags (present in serial number) of inverter families, in order of precedence
+_AA55_FAMILIES: tuple[tuple[tuple[str, ...], type[Inverter], str], ...] = (
+    (ET_MODEL_TAGS, ET, "ET/EH/BT/BH/GEH"),
+    (ES_MODEL_TAGS, ES, "ES/EM/BP"),
+    (DT_MODEL_TAGS, DT, "DT/MS/D-NS/XS/GEP"),
+)
+
+# Validity (in seconds) of the recently discovered inverter family
+_DISCOVERY_CACHE_TTL = 60
+
+# (host, port) -> (time, inverter class) of recently discovered inverters
+_DISCOVERY_CACHE: dict[tuple[str, int], tuple[float, type[Inverter]]] = {}
+
 
 async def connect(host: str, port: int = GOODWE_UDP_PORT, family: str = None, comm_addr: int = 0, timeout: int = 1,
                   retries: int = 3, do_discover: bool = True) -> Inverter:
@@ -61,54 +80,57 @@ async def discover(host: str, port: int = GOODWE_UDP_PORT, timeout: int = 1, ret
 
     Raise InverterError if unable to contact or recognise supported inverter
     """
-    failures = []
-
-    if port == GOODWE_UDP_PORT:
-        # Try the common AA55C07F0102000241 command first and detect inverter type from serial_number
-        try:
-            logger.debug("Probing inverter at %s:%s.", host, port)
-            response = await DISCOVERY_COMMAND.execute(UdpInverterProtocol(host, port, timeout, retries))
-            response = response.response_data()
-            model_name = response[5:15].decode("ascii").rstrip()
-            serial_number = response[31:47].decode("ascii")
-
-            i: Inverter | None = None
-            for model_tag in ET_MODEL_TAGS:
-                if model_tag in serial_number:
-                    logger.debug("Detected ET/EH/BT/BH/GEH inverter %s, S/N:%s.", model_name, serial_number)
-                    i = ET(host, port, 0, timeout, retries)
-                    break
-            if not i:
-                for model_tag in ES_MODEL_TAGS:
-                    if model_tag in serial_number:
-                        logger.debug("Detected ES/EM/BP inverter %s, S/N:%s.", model_name, serial_number)
-                        i = ES(host, port, 0, timeout, retries)
-                        break
-            if not i:
-                for model_tag in DT_MODEL_TAGS:
-                    if model_tag in serial_number:
-                        logger.debug("Detected DT/MS/D-NS/XS/GEP inverter %s, S/N:%s.", model_name, serial_number)
-                        i = DT(host, port, 0, timeout, retries)
-                        break
-            if i:
-                await i.read_device_info()
-                logger.debug("Connected to inverter %s, S/N:%s.", i.model_name, i.serial_number)
-                return i
-
-        except InverterError as ex:
-            failures.append(ex)
-
-    # Probe inverter specific protocols
-    for inv in [ET, DT, ES]:
-        i = inv(host, port, 0, timeout, retries)
+    cached = _DISCOVERY_CACHE.get((host, port))
+    if cached and time.monotonic() - cached[0] < _DISCOVERY_CACHE_TTL:
+        i = cached[1](host, port, 0, timeout, retries)
         try:
-            logger.debug("Probing %s inverter at %s.", inv.__name__, host)
+            logger.debug("Connecting to recently discovered %s inverter at %s.", cached[1].__name__, host)
             await i.read_device_info()
-            await i.read_runtime_data()
-            logger.debug("Detected %s family inverter %s, S/N:%s.", inv.__name__, i.model_name, i.serial_number)
             return i
-        except InverterError as ex:
-            failures.append(ex)
+        except InverterError:
+            logger.debug("Recently discovered %s inverter not responding, discovering again.", cached[1].__name__)
+            _DISCOVERY_CACHE.pop((host, port), None)
+
+    i = await _discover(host, port, timeout, retries)
+    _DISCOVERY_CACHE[(host, port)] = (time.monotonic(), type(i))
+    return i
+
+
+def clear_discovery_cache() -> None:
+    """Forget the inverter families detected by recent discover() calls"""
+    _DISCOVERY_CACHE.clear()
+
+
+async def _discover(host: str, port: int, timeout: int, retries: int) -> Inverter:
+    """Detect the inverter family by probing the inverter protocols and answer appropriate Inverter instance
+
+    Raise InverterError if unable to contact or recognise supported inverter
+    """
+    failures = []
+
+    # Probe the common AA55C07F0102000241 command (detecting the inverter type from serial number) first,
+    # then the inverter specific protocols, the first successful one (in this order) wins.
+    # Each probe gets a head start of single request timeout before the next one is started,
+    # so the inverter (its wifi dongle) is not flooded by several (mostly wrong protocol) requests at once.
+    probes = [functools.partial(_probe, inv, host, port, timeout, retries) for inv in (ET, DT, ES)]
+    if port == GOODWE_UDP_PORT:
+        probes.insert(0, functools.partial(_probe_aa55, host, port, timeout, retries))
+    tasks = []
+    try:
+        for probe in probes:
+            tasks.append(asyncio.ensure_future(probe()))
+            await asyncio.wait((tasks[-1],), timeout=timeout)
+            if any(task.done() and not task.cancelled() and task.exception() is None for task in tasks):
+                break
+        for task in tasks:
+            try:
+                return await task
+            except InverterError as ex:
+                failures.append(ex)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     raise InverterError(
         "Unable to connect to the inverter at "
         f"host={host}, or your inverter is not supported yet.\n"
@@ -116,18 +138,60 @@ async def discover(host: str, port: int = GOODWE_UDP_PORT, timeout: int = 1, ret
     )
 
 
-async def search_inverters() -> bytes:
+async def _probe_aa55(host: str, port: int, timeout: int, retries: int) -> Inverter:
+    """Contact the inverter with the common AA55 protocol, detect its family from serial number
+    and answer appropriate Inverter instance
+
+    Raise InverterError if the inverter does not respond or its family is not recognised
+    """
+    logger.debug("Probing inverter at %s:%s.", host, port)
+    response = await DISCOVERY_COMMAND.execute(UdpInverterProtocol(host, port, 0, timeout, retries))
+    response = response.response_data()
+    if len(response) < _AA55_DEVICE_INFO.size:
+        raise InverterError(f"Unexpected response to discovery command: {response.hex()}.")
+    model_name, serial_number = _AA55_DEVICE_INFO.unpack_from(response)
+    model_name = model_name.decode("ascii").rstrip()
+    serial_number = serial_number.decode("ascii")
+
+    for model_tags, inv, families in _AA55_FAMILIES:
+        if any(model_tag in serial_number for model_tag in model_tags):
+            logger.debug("Detected %s inverter %s, S/N:%s.", families, model_name, serial_number)
+            i = inv(host, port, 0, timeout, retries)
+            break
+    else:
+        raise InverterError(f"Unrecognised inverter {model_name}, S/N:{serial_number}.")
+
+    await i.read_device_info()
+    logger.debug("Connected to inverter %s, S/N:%s.", i.model_name, i.serial_number)
+    return i
+
+
+async def _probe(inv: type[Inverter], host: str, port: int, timeout: int, retries: int) -> Inverter:
+    """Contact the inverter with protocol of specified inverter family and answer its Inverter instance
+
+    Raise InverterError if the inverter does not respond to that protocol
+    """
+    i = inv(host, port, 0, timeout, retries)
+    logger.debug("Probing %s inverter at %s.", inv.__name__, host)
+    await i.read_device_info()
+    await i.read_runtime_data()
+    logger.debug("Detected %s family inverter %s, S/N:%s.", inv.__name__, i.model_name, i.serial_number)
+    return i
+
+
+async def search_inverters(timeout: int = 1, retries: int = 3) -> bytes:
     """Scan the network for inverters.
     Answer the inverter discovery response string (which includes it IP address)
+    The broadcast is repeated (up to retries times) when no response is received within timeout seconds.
 
     Raise InverterError if unable to contact any inverter
     """
     logger.debug("Searching inverters by broadcast to port 48899")
     command = ProtocolCommand("WIFIKIT-214028-READ".encode("utf-8"), lambda r: True)
     try:
-        result = await command.execute(UdpInverterProtocol("255.255.255.255", 48899, 1, 0))
+        result = await command.execute(UdpInverterProtocol(BROADCAST_ADDRESS, 48899, 1, timeout, retries))
         if result is not None:
             return result.response_data()
         raise InverterError("No response received to broadcast request.")
-    except asyncio.CancelledError:
+    except RequestFailedException:
         raise InverterError("No valid response received to broadcast request.") from None
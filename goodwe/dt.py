@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
 from .const import *
-from .exceptions import InverterError, RequestFailedException, RequestRejectedException
+from .exceptions import IllegalDataAddressException, InverterError, RequestFailedException, RequestRejectedException
 from .inverter import Inverter, OperationMode, SensorKind as Kind
-from .modbus import ILLEGAL_DATA_ADDRESS
 from .model import is_3_mppt, is_single_phase
 from .protocol import ProtocolCommand
 from .sensor import *
@@ -22,23 +22,21 @@ class DT(Inverter):
         Voltage("vpv1", 30103, "PV1 Voltage", Kind.PV),
         Current("ipv1", 30104, "PV1 Current", Kind.PV),
         Calculated("ppv1",
-                   lambda data: round(read_voltage(data, 30103) * read_current(data, 30104)),
+                   lambda data: read_vi_power(data, 30103),
                    "PV1 Power", "W", Kind.PV),
         Voltage("vpv2", 30105, "PV2 Voltage", Kind.PV),
         Current("ipv2", 30106, "PV2 Current", Kind.PV),
         Calculated("ppv2",
-                   lambda data: round(read_voltage(data, 30105) * read_current(data, 30106)),
+                   lambda data: read_vi_power(data, 30105),
                    "PV2 Power", "W", Kind.PV),
         Voltage("vpv3", 30107, "PV3 Voltage", Kind.PV),
         Current("ipv3", 30108, "PV3 Current", Kind.PV),
         Calculated("ppv3",
-                   lambda data: round(read_voltage(data, 30107) * read_current(data, 30108)),
+                   lambda data: read_vi_power(data, 30107),
                    "PV3 Power", "W", Kind.PV),
         # ppv1 + ppv2 + ppv3
         Calculated("ppv",
-                   lambda data: (round(read_voltage(data, 30103) * read_current(data, 30104))) + (
-                       round(read_voltage(data, 30105) * read_current(data, 30106))) + (
-                                    round(read_voltage(data, 30107) * read_current(data, 30108))),
+                   lambda data: read_vi_power(data, 30103) + read_vi_power(data, 30105) + read_vi_power(data, 30107),
                    "PV Power", "W", Kind.PV),
         # Voltage("vpv4", 14, "PV4 Voltage", Kind.PV),
         # Current("ipv4", 16, "PV4 Current", Kind.PV),
@@ -137,6 +135,12 @@ class DT(Inverter):
         Integer("grid_export_hw", 40345, "Grid Export Limit Enabled (HW)", "", Kind.GRID),
     )
 
+    # Inverter settings keyed by their id, copied to instance settings
+    __all_settings_by_id: MappingProxyType[str, Sensor] = MappingProxyType({s.id_: s for s in __all_settings})
+
+    # (single_phase, three_mppt) -> filtered sensors
+    __sensors_variants: dict[tuple[bool, bool], tuple[Sensor, ...]] = {}
+
     # Settings for single phase inverters
     __settings_single_phase: tuple[Sensor, ...] = (
         Long("grid_export_limit", 40328, "Grid Export Limit", "W", Kind.GRID),
@@ -147,6 +151,12 @@ class DT(Inverter):
         Integer("grid_export_limit", 40336, "Grid Export Limit", "%", Kind.GRID),
     )
 
+    # Phase dependent settings keyed by their id, merged into instance settings
+    __settings_single_phase_by_id: MappingProxyType[str, Sensor] = MappingProxyType(
+        {s.id_: s for s in __settings_single_phase})
+    __settings_three_phase_by_id: MappingProxyType[str, Sensor] = MappingProxyType(
+        {s.id_: s for s in __settings_three_phase})
+
     def __init__(self, host: str, port: int, comm_addr: int = 0, timeout: int = 1, retries: int = 3):
         super().__init__(host, port, comm_addr if comm_addr else 0x7f, timeout, retries)
         self._READ_DEVICE_VERSION_INFO: ProtocolCommand = self._read_command(0x7531, 0x0028)
@@ -156,20 +166,37 @@ class DT(Inverter):
         self._READ_METER_DATA: ProtocolCommand = self._read_command(0x75f3, 0xF)
         self._sensors = self.__all_sensors
         self._sensors_meter = self.__all_sensors_meter
-        self._settings: dict[str, Sensor] = {s.id_: s for s in self.__all_settings}
+        self._settings: dict[str, Sensor] = dict(self.__all_settings_by_id)
+        self._settings_all: tuple[Sensor, ...] | None = None
         self._sensors_map: dict[str, Sensor] | None = None
         self._has_meter: bool = True
+        # has_meter flag and the sensors tuple built for it
+        self._sensors_all: tuple[bool, tuple[Sensor, ...]] | None = None
 
     @staticmethod
     def _single_phase_only(s: Sensor) -> bool:
         """Filter to exclude phase2/3 sensors on single phase inverters"""
-        return not ((s.id_.endswith('2') or s.id_.endswith('3')) and 'pv' not in s.id_)
+        return not s._is_phase23
 
     @staticmethod
     def _pv1_pv2_only(s: Sensor) -> bool:
         """Filter to exclude sensors on < 3 PV inverters"""
         return not s.id_.endswith('pv3')
 
+    @classmethod
+    def _filter_sensors(cls, single_phase: bool, three_mppt: bool) -> tuple[Sensor, ...]:
+        """Answer the sensors of particular inverter variant"""
+        variant = (single_phase, three_mppt)
+        result = cls.__sensors_variants.get(variant)
+        if result is None:
+            result = tuple(
+                s for s in cls.__all_sensors
+                if (not single_phase or cls._single_phase_only(s))
+                and (three_mppt or cls._pv1_pv2_only(s))
+            )
+            cls.__sensors_variants[variant] = result
+        return result
+
     async def read_device_info(self):
         response = await self._read_from_socket(self._READ_DEVICE_VERSION_INFO)
         response = response.response_data()
@@ -192,16 +219,16 @@ class DT(Inverter):
         self.arm_svn_version = read_unsigned_int(response, 74)  # 35038
         self.firmware = f"{self.dsp1_version}.{self.dsp2_version}.{self.arm_version:02x}"
 
-        if is_single_phase(self):
-            self._sensors = tuple(filter(self._single_phase_only, self.__all_sensors))
-            self._settings.update({s.id_: s for s in self.__settings_single_phase})
+        single_phase = is_single_phase(self)
+        three_mppt = is_3_mppt(self)
+        if single_phase:
+            self._settings.update(self.__settings_single_phase_by_id)
         else:
-            self._settings.update({s.id_: s for s in self.__settings_three_phase})
+            self._settings.update(self.__settings_three_phase_by_id)
+        self._settings_all = None
 
-        if is_3_mppt(self):
-            pass
-        else:
-            self._sensors = tuple(filter(self._pv1_pv2_only, self._sensors))
+        self._sensors = self._filter_sensors(single_phase, three_mppt)
+        self._sensors_all = None
 
         try:
             response = await self._read_from_socket(self._READ_METER_VERSION_INFO)
@@ -212,16 +239,17 @@ class DT(Inverter):
             logger.debug("Could not read meter version info.")
 
     async def read_runtime_data(self) -> dict[str, Any]:
-        response = await self._read_from_socket(self._READ_RUNNING_DATA)
-        data = self._map_response(response, self._sensors)
-
-        if self._has_meter:
-            try:
-                response = await self._read_from_socket(self._READ_METER_DATA)
-                data.update(self._map_response(response, self._sensors_meter))
-            except (RequestRejectedException, RequestFailedException):
-                logger.info("Meter values not supported, disabling further attempts.")
-                self._has_meter = False
+        async with self._protocol.session():
+            response = await self._read_from_socket(self._READ_RUNNING_DATA)
+            data = self._decode_response(response, self._sensors)
+
+            if self._has_meter:
+                try:
+                    response = await self._read_from_socket(self._READ_METER_DATA)
+                    self._decode_response(response, self._sensors_meter, data)
+                except (RequestRejectedException, RequestFailedException):
+                    logger.info("Meter values not supported, disabling further attempts.")
+                    self._has_meter = False
 
         return data
 
@@ -231,7 +259,7 @@ class DT(Inverter):
             return await self._read_sensor(sensor)
         if sensor_id.startswith("modbus"):
             response = await self._read_from_socket(self._read_command(int(sensor_id[7:]), 1))
-            return int.from_bytes(response.read(2), byteorder="big", signed=True)
+            return read_bytes2_signed(response)
         raise ValueError(f'Unknown sensor "{sensor_id}"')
 
     async def read_setting(self, setting_id: str) -> Any:
@@ -240,7 +268,7 @@ class DT(Inverter):
             return await self._read_sensor(setting)
         if setting_id.startswith("modbus"):
             response = await self._read_from_socket(self._read_command(int(setting_id[7:]), 1))
-            return int.from_bytes(response.read(2), byteorder="big", signed=True)
+            return read_bytes2_signed(response)
         raise ValueError(f'Unknown setting "{setting_id}"')
 
     async def _read_sensor(self, setting: Sensor) -> Any:
@@ -248,11 +276,12 @@ class DT(Inverter):
             count = (setting.size_ + (setting.size_ % 2)) // 2
             response = await self._read_from_socket(self._read_command(setting.offset, count))
             return setting.read_value(response)
-        except RequestRejectedException as ex:
-            if ex.message == ILLEGAL_DATA_ADDRESS:
-                logger.debug("Unsupported sensor/setting %s", setting.id_)
-                self._settings.pop(setting.id_, None)
-                raise ValueError(f'Unknown sensor/setting "{setting.id_}"')
+        except IllegalDataAddressException:
+            logger.debug("Unsupported sensor/setting %s", setting.id_)
+            self._settings.pop(setting.id_, None)
+            self._settings_all = None
+            raise ValueError(f'Unknown sensor/setting "{setting.id_}"')
+        except RequestRejectedException:
             return None
 
     async def write_setting(self, setting_id: str, value: Any):
@@ -280,9 +309,9 @@ class DT(Inverter):
 
     async def read_settings_data(self) -> dict[str, Any]:
         data = {}
-        for setting in self.settings():
-            value = await self.read_setting(setting.id_)
-            data[setting.id_] = value
+        async with self._protocol.session():
+            for setting in self.settings():
+                data[setting.id_] = await self._read_sensor(setting)
         return data
 
     async def get_grid_export_limit(self) -> int:
@@ -314,10 +343,14 @@ class DT(Inverter):
         return self._sensors_map.get(sensor_id)
 
     def sensors(self) -> tuple[Sensor, ...]:
-        result = self._sensors
-        if self._has_meter:
-            result = result + self._sensors_meter
-        return result
+        if self._sensors_all is None or self._sensors_all[0] != self._has_meter:
+            result = self._sensors
+            if self._has_meter:
+                result = result + self._sensors_meter
+            self._sensors_all = (self._has_meter, result)
+        return self._sensors_all[1]
 
     def settings(self) -> tuple[Sensor, ...]:
-        return tuple(self._settings.values())
+        if self._settings_all is None:
+            self._settings_all = tuple(self._settings.values())
+        return self._settings_all
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
 from .const import *
 from .exceptions import InverterError
@@ -23,20 +24,19 @@ class ES(Inverter):
         Voltage("vpv1", 0, "PV1 Voltage", Kind.PV),  # modbus 0x500
         Current("ipv1", 2, "PV1 Current", Kind.PV),
         Calculated("ppv1",
-                   lambda data: round(read_voltage(data, 0) * read_current(data, 2)),
+                   lambda data: read_vi_power(data, 0),
                    "PV1 Power", "W", Kind.PV),
         Byte("pv1_mode", 4, "PV1 Mode code", "", Kind.PV),
         Enum("pv1_mode_label", 4, PV_MODES, "PV1 Mode", Kind.PV),
         Voltage("vpv2", 5, "PV2 Voltage", Kind.PV),
         Current("ipv2", 7, "PV2 Current", Kind.PV),
         Calculated("ppv2",
-                   lambda data: round(read_voltage(data, 5) * read_current(data, 7)),
+                   lambda data: read_vi_power(data, 5),
                    "PV2 Power", "W", Kind.PV),
         Byte("pv2_mode", 9, "PV2 Mode code", "", Kind.PV),
         Enum("pv2_mode_label", 9, PV_MODES, "PV2 Mode", Kind.PV),
         Calculated("ppv",
-                   lambda data: round(read_voltage(data, 0) * read_current(data, 2)) + round(
-                       read_voltage(data, 5) * read_current(data, 7)),
+                   lambda data: read_vi_power(data, 0) + read_vi_power(data, 5),
                    "PV Power", "W", Kind.PV),
         Voltage("vbattery1", 10, "Battery Voltage", Kind.BAT),  # modbus 0x506
         # Voltage("vbattery2", 12, "Battery Voltage 2", Kind.BAT),
@@ -115,8 +115,8 @@ class ES(Inverter):
         # ppv1 + ppv2 + pbattery - pgrid
         Calculated("house_consumption",
                    lambda data:
-                   round(read_voltage(data, 0) * read_current(data, 2)) +
-                   round(read_voltage(data, 5) * read_current(data, 7)) +
+                   read_vi_power(data, 0) +
+                   read_vi_power(data, 5) +
                    (abs(round(read_voltage(data, 10) * read_current(data, 18))) *
                     (-1 if read_byte(data, 30) == 3 else 1)) -
                    (abs(read_bytes2_signed(data, 38)) * (-1 if read_byte(data, 80) == 2 else 1)),
@@ -154,6 +154,9 @@ class ES(Inverter):
         ByteH("eco_mode_4_switch", 1808, "Eco Mode Group 4 Switch", "", Kind.BAT),
     )
 
+    # Inverter settings keyed by their id, copied to instance settings
+    __all_settings_by_id: MappingProxyType[str, Sensor] = MappingProxyType({s.id_: s for s in __all_settings})
+
     # Settings added in ARM firmware 14
     __settings_arm_fw_14: tuple[Sensor, ...] = (
         EcoModeV2("eco_mode_1", 47547, "Eco Mode Group 1"),
@@ -166,9 +169,21 @@ class ES(Inverter):
         ByteH("eco_mode_4_switch", 47567, "Eco Mode Group 4 Switch"),
     )
 
+    # Firmware dependent settings keyed by their id, merged into instance settings when supported
+    __settings_arm_fw_14_by_id: MappingProxyType[str, Sensor] = MappingProxyType(
+        {s.id_: s for s in __settings_arm_fw_14})
+
+    # Supported operation modes, the latter without the emulated ECO_CHARGE/ECO_DISCHARGE modes
+    __operation_modes: tuple[OperationMode, ...] = tuple(
+        mode for mode in OperationMode if mode not in (OperationMode.PEAK_SHAVING, OperationMode.SELF_USE))
+    __operation_modes_real: tuple[OperationMode, ...] = tuple(
+        mode for mode in __operation_modes if mode not in (OperationMode.ECO_CHARGE, OperationMode.ECO_DISCHARGE))
+
     def __init__(self, host: str, port: int, comm_addr: int = 0, timeout: int = 1, retries: int = 3):
         super().__init__(host, port, comm_addr if comm_addr else 0xf7, timeout, retries)
-        self._settings: dict[str, Sensor] = {s.id_: s for s in self.__all_settings}
+        self._settings: dict[str, Sensor] = dict(self.__all_settings_by_id)
+        self._settings_all: tuple[Sensor, ...] | None = None
+        self._has_eco_mode_v2: bool = False
 
     def _supports_eco_mode_v2(self) -> bool:
         if self.arm_version < 14:
@@ -198,12 +213,14 @@ class ES(Inverter):
         except ValueError:
             logger.exception("Error decoding firmware version %s.", self.firmware)
 
-        if self._supports_eco_mode_v2():
-            self._settings.update({s.id_: s for s in self.__settings_arm_fw_14})
+        self._has_eco_mode_v2 = self._supports_eco_mode_v2()
+        if self._has_eco_mode_v2:
+            self._settings.update(self.__settings_arm_fw_14_by_id)
+            self._settings_all = None
 
     async def read_runtime_data(self) -> dict[str, Any]:
         response = await self._read_from_socket(self._READ_DEVICE_RUNNING_DATA)
-        data = self._map_response(response, self.__sensors)
+        data = self._decode_response(response, self.__sensors)
         return data
 
     async def read_sensor(self, sensor_id: str) -> Any:
@@ -222,7 +239,7 @@ class ES(Inverter):
             return await self._read_setting(setting)
         if setting_id.startswith("modbus"):
             response = await self._read_from_socket(self._read_command(int(setting_id[7:]), 1))
-            return int.from_bytes(response.read(2), byteorder="big", signed=True)
+            return read_bytes2_signed(response)
         if setting_id in self._settings:
             logger.debug("Reading setting %s", setting_id)
             all_settings = await self.read_settings_data()
@@ -287,13 +304,9 @@ class ES(Inverter):
             )
 
     async def get_operation_modes(self, include_emulated: bool) -> tuple[OperationMode, ...]:
-        result = list(OperationMode)
-        result.remove(OperationMode.PEAK_SHAVING)
-        result.remove(OperationMode.SELF_USE)
-        if not include_emulated:
-            result.remove(OperationMode.ECO_CHARGE)
-            result.remove(OperationMode.ECO_DISCHARGE)
-        return tuple(result)
+        if include_emulated:
+            return self.__operation_modes
+        return self.__operation_modes_real
 
     async def get_operation_mode(self) -> OperationMode | None:
         mode_id = await self.read_setting('work_mode')
@@ -353,11 +366,13 @@ class ES(Inverter):
         return self.__sensors
 
     def settings(self) -> tuple[Sensor, ...]:
-        return tuple(self._settings.values())
+        if self._settings_all is None:
+            self._settings_all = tuple(self._settings.values())
+        return self._settings_all
 
     async def _set_general_mode(self) -> None:
         if self.arm_version >= 7:
-            if self._supports_eco_mode_v2():
+            if self._has_eco_mode_v2:
                 await self._clear_battery_mode_param()
             else:
                 await self._set_limit_power_for_charge(0, 0, 0, 0, 0)
@@ -382,7 +397,7 @@ class ES(Inverter):
 
     async def _set_backup_mode(self) -> None:
         if self.arm_version >= 7:
-            if self._supports_eco_mode_v2():
+            if self._has_eco_mode_v2:
                 await self._clear_battery_mode_param()
             else:
                 await self._clear_battery_mode_param()
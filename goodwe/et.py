@@ -2,17 +2,45 @@
 from __future__ import annotations
 
 import logging
+import time
+from struct import Struct
+from types import MappingProxyType
 
 from .const import *
-from .exceptions import RequestFailedException, RequestRejectedException
+from .exceptions import IllegalDataAddressException, RequestFailedException, RequestRejectedException
 from .inverter import Inverter, OperationMode, SensorKind as Kind
-from .modbus import ILLEGAL_DATA_ADDRESS
 from .model import is_2_battery, is_4_mppt, is_745_platform, is_single_phase
-from .protocol import ProtocolCommand
+from .protocol import ProtocolCommand, ProtocolResponse
 from .sensor import *
 
 logger = logging.getLogger(__name__)
 
+# Device info registers 35000 - 35032
+_DEVICE_INFO = Struct(">HHH16s10sHHHHH12s12s")
+
+# PV1 - PV4 power registers 35105, 35109, 35113, 35117 (each followed by voltage and current of the next string)
+_PV_POWERS = Struct(">I4xI4xI4xI")
+
+# Validity (in seconds) of the recently written register values kept for 1 byte settings writes
+_REGISTERS_CACHE_TTL = 5
+
+# Validity (in seconds) of the recently read operation mode
+_OPERATION_MODE_CACHE_TTL = 2
+
+# Values of registers 47511 - 47512 to switch the inverter off-grid (offline) or back on-grid
+_OFFLINE_ON = bytes.fromhex('00070000')
+_OFFLINE_OFF = bytes.fromhex('00010000')
+
+
+def _read_pv_power(data: ProtocolResponse) -> int:
+    """Retrieve total PV power (ppv1 + ppv2 + ppv3 + ppv4) from running data"""
+    data.seek(35105)
+    values = data.unpack(_PV_POWERS)
+    if values is None:
+        # truncated response, read the values one by one (as zero padded)
+        return sum(read_bytes4(data, offset, 0) for offset in (35105, 35109, 35113, 35117))
+    return sum(value for value in values if value != 0xffffffff)
+
 
 class ET(Inverter):
     """Class representing inverter of ET/EH/BT/BH or GE's GEH families AKA platform 205 or 745"""
@@ -33,13 +61,7 @@ class ET(Inverter):
         Current("ipv4", 35116, "PV4 Current", Kind.PV),
         Power4("ppv4", 35117, "PV4 Power", Kind.PV),
         # ppv1 + ppv2 + ppv3 + ppv4
-        Calculated("ppv",
-                   lambda data:
-                   max(0, read_bytes4(data, 35105, 0)) +
-                   max(0, read_bytes4(data, 35109, 0)) +
-                   max(0, read_bytes4(data, 35113, 0)) +
-                   max(0, read_bytes4(data, 35117, 0)),
-                   "PV Power", "W", Kind.PV),
+        Calculated("ppv", _read_pv_power, "PV Power", "W", Kind.PV),
         ByteH("pv4_mode", 35119, "PV4 Mode code", "", Kind.PV),
         EnumH("pv4_mode_label", 35119, PV_MODES, "PV4 Mode", Kind.PV),
         ByteL("pv3_mode", 35119, "PV3 Mode code", "", Kind.PV),
@@ -145,10 +167,7 @@ class ET(Inverter):
         # ppv1 + ppv2 + ppv3 + ppv4 + pbattery1 - active_power
         Calculated("house_consumption",
                    lambda data:
-                   read_bytes4(data, 35105, 0) +
-                   read_bytes4(data, 35109, 0) +
-                   read_bytes4(data, 35113, 0) +
-                   read_bytes4(data, 35117, 0) +
+                   _read_pv_power(data) +
                    read_bytes4_signed(data, 35182) -
                    read_bytes2_signed(data, 35140),
                    "House Consumption", "W", Kind.AC),
@@ -431,6 +450,8 @@ class ET(Inverter):
         Integer("bms2_battery_string_rate_v", 47935, "BMS2 Battery String Rate Voltage"),
 
     )
+    # Settings keyed by their id, built once and copied by each inverter instance
+    __all_settings_by_id: MappingProxyType[str, Sensor] = MappingProxyType({s.id_: s for s in __all_settings})
 
     # Settings added in ARM firmware 19
     __settings_arm_fw_19: tuple[Sensor, ...] = (
@@ -469,6 +490,15 @@ class ET(Inverter):
         Integer("eco_mode_enable", 47612, "Eco Mode Switch"),
     )
 
+    # Firmware dependent settings keyed by their id, merged into instance settings when supported
+    __settings_arm_fw_19_by_id: MappingProxyType[str, Sensor] = MappingProxyType(
+        {s.id_: s for s in __settings_arm_fw_19})
+    __settings_arm_fw_22_by_id: MappingProxyType[str, Sensor] = MappingProxyType(
+        {s.id_: s for s in __settings_arm_fw_22})
+
+    # (no_pv34, single_phase, extended) -> filtered (sensors, meter, meter extended, meter basic) sensors
+    __sensors_variants: dict[tuple[bool, bool, bool], tuple[tuple[Sensor, ...], ...]] = {}
+
     def __init__(self, host: str, port: int, comm_addr: int = 0, timeout: int = 1, retries: int = 3):
         super().__init__(host, port, comm_addr if comm_addr else 0xf7, timeout, retries)
         self._READ_DEVICE_VERSION_INFO: ProtocolCommand = self._read_command(0x88b8, 0x0021)
@@ -486,18 +516,33 @@ class ET(Inverter):
         self._has_meter_extended: bool = False
         self._has_meter_extended2: bool = False
         self._has_mppt: bool = False
+        # model traits derived from serial number, known once read_device_info() is executed
+        self._is_single_phase: bool | None = None
+        self._is_745_platform: bool | None = None
+        self._is_4_mppt: bool | None = None
+        self._is_2_battery: bool | None = None
         self._sensors = self.__all_sensors
         self._sensors_battery = self.__all_sensors_battery
         self._sensors_battery2 = self.__all_sensors_battery2
         self._sensors_meter = self.__all_sensors_meter
+        # meter sensors for the shorter meter reads, used when extended meter registers are not supported
+        self._sensors_meter_extended = tuple(filter(self._not_extended_meter2, self._sensors_meter))
+        self._sensors_meter_basic = tuple(filter(self._not_extended_meter, self._sensors_meter))
         self._sensors_mppt = self.__all_sensors_mppt
-        self._settings: dict[str, Sensor] = {s.id_: s for s in self.__all_settings}
+        self._settings: dict[str, Sensor] = dict(self.__all_settings_by_id)
+        self._settings_all: tuple[Sensor, ...] | None = None
         self._sensors_map: dict[str, Sensor] | None = None
+        # offset -> (time, raw value) of registers recently written by 1 byte settings
+        self._registers_cache: dict[int, tuple[float, bytes]] = {}
+        # (time, mode) of recently read operation mode
+        self._operation_mode: tuple[float, OperationMode | None] | None = None
+        # (battery, battery2, mppt) flags and the sensors tuple built for them
+        self._sensors_all: tuple[tuple[bool, bool, bool], tuple[Sensor, ...]] | None = None
 
     @staticmethod
     def _single_phase_only(s: Sensor) -> bool:
         """Filter to exclude phase2/3 sensors on single phase inverters"""
-        return not ((s.id_.endswith('2') or s.id_.endswith('3')) and 'pv' not in s.id_)
+        return not s._is_phase23
 
     @staticmethod
     def _not_extended_meter(s: Sensor) -> bool:
@@ -509,138 +554,177 @@ class ET(Inverter):
         """Filter to exclude extended meter sensors"""
         return s.offset < 36058
 
+    @classmethod
+    def _filter_sensors(cls, no_pv34: bool, single_phase: bool, extended: bool) -> tuple[tuple[Sensor, ...], ...]:
+        """Answer the (sensors, meter, meter extended, meter basic) sensors of particular inverter variant"""
+        variant = (no_pv34, single_phase, extended)
+        result = cls.__sensors_variants.get(variant)
+        if result is None:
+            sensors = tuple(
+                s for s in cls.__all_sensors
+                if not (no_pv34 and s._is_pv34)
+                and (not single_phase or cls._single_phase_only(s))
+            )
+            sensors_meter = tuple(
+                s for s in cls.__all_sensors_meter
+                if (not single_phase or cls._single_phase_only(s))
+                and (extended or cls._not_extended_meter(s))
+            )
+            result = (
+                sensors,
+                sensors_meter,
+                tuple(filter(cls._not_extended_meter2, sensors_meter)),
+                tuple(filter(cls._not_extended_meter, sensors_meter)),
+            )
+            cls.__sensors_variants[variant] = result
+        return result
+
     async def read_device_info(self):
         response = await self._read_from_socket(self._READ_DEVICE_VERSION_INFO)
-        response = response.response_data()
         # Modbus registers from 35000 - 35032
-        self.modbus_version = read_unsigned_int(response, 0)
-        self.rated_power = read_unsigned_int(response, 2)
-        self.ac_output_type = read_unsigned_int(response, 4)  # 0: 1-phase, 1: 3-phase (4 wire), 2: 3-phase (3 wire)
-        self.serial_number = self._decode(response[6:22])  # 35003 - 350010
-        self.model_name = self._decode(response[22:32])  # 35011 - 35015
-        self.dsp1_version = read_unsigned_int(response, 32)  # 35016
-        self.dsp2_version = read_unsigned_int(response, 34)  # 35017
-        self.dsp_svn_version = read_unsigned_int(response, 36)  # 35018
-        self.arm_version = read_unsigned_int(response, 38)  # 35019
-        self.arm_svn_version = read_unsigned_int(response, 40)  # 35020
-        self.firmware = self._decode(response[42:54])  # 35021 - 35027
-        self.arm_firmware = self._decode(response[54:66])  # 35027 - 35032
-
-        if not is_4_mppt(self) and self.rated_power < 15000:
-            # This inverter does not have 4 MPPTs or PV strings
-            self._sensors = tuple(filter(lambda s: not ('pv4' in s.id_), self._sensors))
-            self._sensors = tuple(filter(lambda s: not ('pv3' in s.id_), self._sensors))
-
-        if is_single_phase(self):
-            # this is single phase inverter, filter out all L2 and L3 sensors
-            self._sensors = tuple(filter(self._single_phase_only, self._sensors))
-            self._sensors_meter = tuple(filter(self._single_phase_only, self._sensors_meter))
-
-        if is_2_battery(self) or self.rated_power >= 25000:
+        (
+            self.modbus_version,
+            self.rated_power,
+            self.ac_output_type,  # 0: 1-phase, 1: 3-phase (4 wire), 2: 3-phase (3 wire)
+            serial_number,  # 35003 - 350010
+            model_name,  # 35011 - 35015
+            self.dsp1_version,  # 35016
+            self.dsp2_version,  # 35017
+            self.dsp_svn_version,  # 35018
+            self.arm_version,  # 35019
+            self.arm_svn_version,  # 35020
+            firmware,  # 35021 - 35027
+            arm_firmware,  # 35027 - 35032
+        ) = _DEVICE_INFO.unpack_from(response.response_data())
+        self.serial_number = self._decode(serial_number)
+        self.model_name = self._decode(model_name)
+        self.firmware = self._decode(firmware)
+        self.arm_firmware = self._decode(arm_firmware)
+        self._is_single_phase = is_single_phase(self)
+        self._is_745_platform = is_745_platform(self)
+        self._is_4_mppt = is_4_mppt(self)
+        self._is_2_battery = is_2_battery(self)
+
+        # This inverter does not have 4 MPPTs or PV strings
+        no_pv34 = not self._is_4_mppt and self.rated_power < 15000
+        # this is single phase inverter, filter out all L2 and L3 sensors
+        single_phase = self._is_single_phase
+        extended = self._is_745_platform or self.rated_power >= 15000
+
+        (
+            self._sensors,
+            self._sensors_meter,
+            self._sensors_meter_extended,
+            self._sensors_meter_basic,
+        ) = self._filter_sensors(no_pv34, single_phase, extended)
+        self._sensors_all = None
+
+        if self._is_2_battery or self.rated_power >= 25000:
             self._has_battery2 = True
 
-        if is_745_platform(self) or self.rated_power >= 15000:
+        if extended:
             self._has_mppt = True
             self._has_meter_extended = True
             self._has_meter_extended2 = True
-        else:
-            self._sensors_meter = tuple(filter(self._not_extended_meter, self._sensors_meter))
 
-        # Check and add EcoModeV2 settings added in (ETU fw 19)
-        try:
-            await self._read_from_socket(self._read_command(47547, 6))
-            self._settings.update({s.id_: s for s in self.__settings_arm_fw_19})
-        except RequestRejectedException as ex:
-            if ex.message == ILLEGAL_DATA_ADDRESS:
-                logger.debug("EcoModeV2 settings not supported, switching to EcoModeV1.")
-                self._has_eco_mode_v2 = False
-        except RequestFailedException:
-            logger.debug("Cannot read EcoModeV2 settings, switching to EcoModeV1.")
-            self._has_eco_mode_v2 = False
+        # Check and add EcoModeV2 settings added in (ETU fw 19) and Peak Shaving settings added in (ETU fw 22)
+        self._has_eco_mode_v2 = await self._is_supported(47547, 6)
+        self._has_peak_shaving = await self._is_supported(47589, 6)
+        if self._has_eco_mode_v2:
+            self._settings.update(self.__settings_arm_fw_19_by_id)
+            self._settings_all = None
+        else:
+            logger.debug("EcoModeV2 settings not supported, switching to EcoModeV1.")
+        if self._has_peak_shaving:
+            self._settings.update(self.__settings_arm_fw_22_by_id)
+            self._settings_all = None
+        else:
+            logger.debug("PeakShaving setting not supported, disabling it.")
 
-        # Check and add Peak Shaving settings added in (ETU fw 22)
+    async def _is_supported(self, offset: int, count: int) -> bool:
+        """Probe if the inverter (firmware) supports the registers by reading them"""
         try:
-            await self._read_from_socket(self._read_command(47589, 6))
-            self._settings.update({s.id_: s for s in self.__settings_arm_fw_22})
+            await self._read_from_socket(self._read_command(offset, count))
+            return True
         except RequestRejectedException as ex:
-            if ex.message == ILLEGAL_DATA_ADDRESS:
-                logger.debug("PeakShaving setting not supported, disabling it.")
-                self._has_peak_shaving = False
+            logger.debug("Registers %d-%d rejected: %s.", offset, offset + count - 1, ex.message)
+            return False
         except RequestFailedException:
-            logger.debug("Cannot read _has_peak_shaving settings, disabling it.")
-            self._has_peak_shaving = False
+            logger.debug("Cannot read registers %d-%d.", offset, offset + count - 1)
+            return False
 
     async def read_runtime_data(self) -> dict[str, Any]:
-        response = await self._read_from_socket(self._READ_RUNNING_DATA)
-        data = self._map_response(response, self._sensors)
+        async with self._protocol.session():
+            response = await self._read_from_socket(self._READ_RUNNING_DATA)
+            data = self._decode_response(response, self._sensors)
 
-        self._has_battery = data.get('battery_mode', 0) != 0
-        if self._has_battery:
-            try:
-                response = await self._read_from_socket(self._READ_BATTERY_INFO)
-                data.update(self._map_response(response, self._sensors_battery))
-            except RequestRejectedException as ex:
-                if ex.message == ILLEGAL_DATA_ADDRESS:
-                    logger.info("Battery values not supported, disabling further attempts.")
-                    self._has_battery = False
-                else:
-                    raise ex
-        if self._has_battery2:
-            try:
-                response = await self._read_from_socket(self._READ_BATTERY2_INFO)
-                data.update(
-                    self._map_response(response, self._sensors_battery2))
-            except RequestRejectedException as ex:
-                if ex.message == ILLEGAL_DATA_ADDRESS:
-                    logger.info("Battery 2 values not supported, disabling further attempts.")
-                    self._has_battery2 = False
-                else:
-                    raise ex
+            self._has_battery = data.get('battery_mode', 0) != 0
+            data.update(await self._read_battery_data())
+            data.update(await self._read_battery2_data())
+            data.update(await self._read_meter_data())
+            data.update(await self._read_mppt_data())
 
+        return data
+
+    async def _read_battery_data(self) -> dict[str, Any]:
+        if not self._has_battery:
+            return {}
+        try:
+            response = await self._read_from_socket(self._READ_BATTERY_INFO)
+            return self._decode_response(response, self._sensors_battery)
+        except IllegalDataAddressException:
+            logger.info("Battery values not supported, disabling further attempts.")
+            self._has_battery = False
+            return {}
+
+    async def _read_battery2_data(self) -> dict[str, Any]:
+        if not self._has_battery2:
+            return {}
+        try:
+            response = await self._read_from_socket(self._READ_BATTERY2_INFO)
+            return self._decode_response(response, self._sensors_battery2)
+        except IllegalDataAddressException:
+            logger.info("Battery 2 values not supported, disabling further attempts.")
+            self._has_battery2 = False
+            return {}
+
+    async def _read_meter_data(self) -> dict[str, Any]:
         if self._has_meter_extended2:
             try:
                 response = await self._read_from_socket(self._READ_METER_DATA_EXTENDED2)
-                data.update(self._map_response(response, self._sensors_meter))
-            except RequestRejectedException as ex:
-                if ex.message == ILLEGAL_DATA_ADDRESS:
-                    logger.info("Extended meter values not supported, disabling further attempts.")
-                    self._has_meter_extended2 = False
-                    self._sensors_meter = tuple(filter(self._not_extended_meter2, self._sensors_meter))
-                    response = await self._read_from_socket(self._READ_METER_DATA_EXTENDED)
-                    data.update(
-                        self._map_response(response, self._sensors_meter))
-                else:
-                    raise ex
+                return self._decode_response(response, self._sensors_meter)
+            except IllegalDataAddressException:
+                logger.info("Extended meter values not supported, disabling further attempts.")
+                self._has_meter_extended2 = False
+                self._sensors_meter = self._sensors_meter_extended
+                self._sensors_all = None
+                response = await self._read_from_socket(self._READ_METER_DATA_EXTENDED)
+                return self._decode_response(response, self._sensors_meter)
         elif self._has_meter_extended:
             try:
                 response = await self._read_from_socket(self._READ_METER_DATA_EXTENDED)
-                data.update(self._map_response(response, self._sensors_meter))
-            except RequestRejectedException as ex:
-                if ex.message == ILLEGAL_DATA_ADDRESS:
-                    logger.info("Extended meter values not supported, disabling further attempts.")
-                    self._has_meter_extended = False
-                    self._sensors_meter = tuple(filter(self._not_extended_meter, self._sensors_meter))
-                    response = await self._read_from_socket(self._READ_METER_DATA)
-                    data.update(
-                        self._map_response(response, self._sensors_meter))
-                else:
-                    raise ex
+                return self._decode_response(response, self._sensors_meter)
+            except IllegalDataAddressException:
+                logger.info("Extended meter values not supported, disabling further attempts.")
+                self._has_meter_extended = False
+                self._sensors_meter = self._sensors_meter_basic
+                self._sensors_all = None
+                response = await self._read_from_socket(self._READ_METER_DATA)
+                return self._decode_response(response, self._sensors_meter)
         else:
             response = await self._read_from_socket(self._READ_METER_DATA)
-            data.update(self._map_response(response, self._sensors_meter))
+            return self._decode_response(response, self._sensors_meter)
 
-        if self._has_mppt:
-            try:
-                response = await self._read_from_socket(self._READ_MPPT_DATA)
-                data.update(self._map_response(response, self._sensors_mppt))
-            except RequestRejectedException as ex:
-                if ex.message == ILLEGAL_DATA_ADDRESS:
-                    logger.info("MPPT values not supported, disabling further attempts.")
-                    self._has_mppt = False
-                else:
-                    raise ex
-
-        return data
+    async def _read_mppt_data(self) -> dict[str, Any]:
+        if not self._has_mppt:
+            return {}
+        try:
+            response = await self._read_from_socket(self._READ_MPPT_DATA)
+            return self._decode_response(response, self._sensors_mppt)
+        except IllegalDataAddressException:
+            logger.info("MPPT values not supported, disabling further attempts.")
+            self._has_mppt = False
+            return {}
 
     async def read_sensor(self, sensor_id: str) -> Any:
         sensor: Sensor = self._get_sensor(sensor_id)
@@ -648,7 +732,7 @@ class ET(Inverter):
             return await self._read_sensor(sensor)
         if sensor_id.startswith("modbus"):
             response = await self._read_from_socket(self._read_command(int(sensor_id[7:]), 1))
-            return int.from_bytes(response.read(2), byteorder="big", signed=True)
+            return read_bytes2_signed(response)
         raise ValueError(f'Unknown sensor "{sensor_id}"')
 
     async def read_setting(self, setting_id: str) -> Any:
@@ -657,7 +741,7 @@ class ET(Inverter):
             return await self._read_sensor(setting)
         if setting_id.startswith("modbus"):
             response = await self._read_from_socket(self._read_command(int(setting_id[7:]), 1))
-            return int.from_bytes(response.read(2), byteorder="big", signed=True)
+            return read_bytes2_signed(response)
         raise ValueError(f'Unknown setting "{setting_id}"')
 
     async def _read_sensor(self, sensor: Sensor) -> Any:
@@ -665,11 +749,12 @@ class ET(Inverter):
             count = (sensor.size_ + (sensor.size_ % 2)) // 2
             response = await self._read_from_socket(self._read_command(sensor.offset, count))
             return sensor.read_value(response)
-        except RequestRejectedException as ex:
-            if ex.message == ILLEGAL_DATA_ADDRESS:
-                logger.debug("Unsupported sensor/setting %s", sensor.id_)
-                self._settings.pop(sensor.id_, None)
-                raise ValueError(f'Unknown sensor/setting "{sensor.id_}"')
+        except IllegalDataAddressException:
+            logger.debug("Unsupported sensor/setting %s", sensor.id_)
+            self._settings.pop(sensor.id_, None)
+            self._settings_all = None
+            raise ValueError(f'Unknown sensor/setting "{sensor.id_}"')
+        except RequestRejectedException:
             return None
 
     async def write_setting(self, setting_id: str, value: Any):
@@ -678,6 +763,7 @@ class ET(Inverter):
             await self._write_setting(setting, value)
         else:
             if setting_id.startswith("modbus"):
+                self._clear_cached_values()
                 await self._read_from_socket(self._write_command(int(setting_id[7:]), int(value)))
             else:
                 raise ValueError(f'Unknown setting "{setting_id}"')
@@ -685,27 +771,45 @@ class ET(Inverter):
     async def _write_setting(self, setting: Sensor, value: Any):
         if setting.size_ == 1:
             # modbus can address/store only 16 bit values, read the other 8 bytes
-            response = await self._read_from_socket(self._read_command(setting.offset, 1))
-            raw_value = setting.encode_value(value, response.response_data()[0:2])
+            raw_value = setting.encode_value(value, await self._read_register(setting.offset))
         else:
             raw_value = setting.encode_value(value)
+        self._clear_cached_values()
         if len(raw_value) <= 2:
             value = int.from_bytes(raw_value, byteorder="big", signed=True)
             await self._read_from_socket(self._write_command(setting.offset, value))
         else:
             await self._read_from_socket(self._write_multi_command(setting.offset, raw_value))
+        if setting.size_ == 1:
+            self._registers_cache[setting.offset] = (time.monotonic(), raw_value)
+
+    def _clear_cached_values(self) -> None:
+        """Forget the recently written registers and read operation mode, the inverter state is being changed"""
+        self._registers_cache.clear()
+        self._operation_mode = None
+
+    async def _read_register(self, offset: int) -> bytes:
+        """Read raw value of single register, unless it was written (by this instance) just recently"""
+        cached = self._registers_cache.get(offset)
+        if cached and time.monotonic() - cached[0] < _REGISTERS_CACHE_TTL:
+            return cached[1]
+        response = await self._read_from_socket(self._read_command(offset, 1))
+        return response.response_data()[0:2]
 
     async def read_settings_data(self) -> dict[str, Any]:
         data = {}
-        for setting in self.settings():
-            try:
-                value = await self.read_setting(setting.id_)
-                data[setting.id_] = value
-            except (ValueError, RequestFailedException):
-                logger.exception("Error reading setting %s.", setting.id_)
-                data[setting.id_] = None
+        async with self._protocol.session():
+            for setting in self.settings():
+                data[setting.id_] = await self._read_setting_value(setting)
         return data
 
+    async def _read_setting_value(self, setting: Sensor) -> Any:
+        try:
+            return await self._read_sensor(setting)
+        except (ValueError, RequestFailedException):
+            logger.exception("Error reading setting %s.", setting.id_)
+            return None
+
     async def get_grid_export_limit(self) -> int:
         return await self.read_setting('grid_export_limit')
 
@@ -714,17 +818,24 @@ class ET(Inverter):
             await self.write_setting('grid_export_limit', export_limit)
 
     async def get_operation_modes(self, include_emulated: bool) -> tuple[OperationMode, ...]:
-        result = list(OperationMode)
+        excluded = set()
         if not self._has_peak_shaving:
-            result.remove(OperationMode.PEAK_SHAVING)
-        if not is_745_platform(self):
-            result.remove(OperationMode.SELF_USE)
+            excluded.add(OperationMode.PEAK_SHAVING)
+        if not self._is_745_platform:
+            excluded.add(OperationMode.SELF_USE)
         if not include_emulated:
-            result.remove(OperationMode.ECO_CHARGE)
-            result.remove(OperationMode.ECO_DISCHARGE)
-        return tuple(result)
+            excluded.update((OperationMode.ECO_CHARGE, OperationMode.ECO_DISCHARGE))
+        return tuple(mode for mode in OperationMode if mode not in excluded)
 
     async def get_operation_mode(self) -> OperationMode | None:
+        cached = self._operation_mode
+        if cached and time.monotonic() - cached[0] < _OPERATION_MODE_CACHE_TTL:
+            return cached[1]
+        mode = await self._read_operation_mode()
+        self._operation_mode = (time.monotonic(), mode)
+        return mode
+
+    async def _read_operation_mode(self) -> OperationMode | None:
         mode_id = await self.read_setting('work_mode')
         try:
             mode = OperationMode(mode_id)
@@ -779,11 +890,13 @@ class ET(Inverter):
                 await self._read_sensor(eco_mode)
             except ValueError:
                 pass
-            eco_mode.set_schedule_type(ScheduleType.ECO_MODE, is_745_platform(self))
+            eco_mode.set_schedule_type(ScheduleType.ECO_MODE, self._is_745_platform)
             if operation_mode == OperationMode.ECO_CHARGE:
                 await self.write_setting('eco_mode_1', eco_mode.encode_charge(eco_mode_power, eco_mode_soc))
             else:
                 await self.write_setting('eco_mode_1', eco_mode.encode_discharge(eco_mode_power))
+            # The switches are not adjacent registers (they sit inside their eco mode groups),
+            # so each one is written on its own, not to rewrite the rest of the groups
             await self.write_setting('eco_mode_2_switch', 0)
             await self.write_setting('eco_mode_3_switch', 0)
             await self.write_setting('eco_mode_4_switch', 0)
@@ -803,21 +916,28 @@ class ET(Inverter):
         return self._sensors_map.get(sensor_id)
 
     def sensors(self) -> tuple[Sensor, ...]:
-        result = self._sensors + self._sensors_meter
-        if self._has_battery:
-            result = result + self._sensors_battery
-        if self._has_battery2:
-            result = result + self._sensors_battery2
-        if self._has_mppt:
-            result = result + self._sensors_mppt
-        return result
+        flags = (self._has_battery, self._has_battery2, self._has_mppt)
+        if self._sensors_all is None or self._sensors_all[0] != flags:
+            result = self._sensors + self._sensors_meter
+            if self._has_battery:
+                result = result + self._sensors_battery
+            if self._has_battery2:
+                result = result + self._sensors_battery2
+            if self._has_mppt:
+                result = result + self._sensors_mppt
+            self._sensors_all = (flags, result)
+        return self._sensors_all[1]
 
     def settings(self) -> tuple[Sensor, ...]:
-        return tuple(self._settings.values())
+        if self._settings_all is None:
+            self._settings_all = tuple(self._settings.values())
+        return self._settings_all
 
     async def _clear_battery_mode_param(self) -> None:
+        self._clear_cached_values()
         await self._read_from_socket(self._write_command(0xb9ad, 1))
 
     async def _set_offline(self, mode: bool) -> None:
-        value = bytes.fromhex('00070000') if mode else bytes.fromhex('00010000')
+        value = _OFFLINE_ON if mode else _OFFLINE_OFF
+        self._clear_cached_values()
         await self._read_from_socket(self._write_multi_command(0xb997, value))
@@ -32,6 +32,16 @@ class RequestRejectedException(InverterError):
         self.message: str = message
 
 
+class IllegalDataAddressException(RequestRejectedException):
+    """
+    Indicates request sent to inverter was rejected with ILLEGAL DATA ADDRESS exception response,
+    i.e. the requested registers are not supported by the inverter (firmware).
+    """
+
+    def __init__(self, message: str = 'ILLEGAL DATA ADDRESS'):
+        super().__init__(message)
+
+
 class PartialResponseException(InverterError):
     """
     Indicates the received response data are incomplete and is probably fragmented to multiple packets.
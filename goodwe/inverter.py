@@ -5,6 +5,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, IntEnum
+from struct import Struct, calcsize
 from typing import Any, Callable, Optional
 
 from .exceptions import MaxRetriesException, RequestFailedException
@@ -12,6 +13,11 @@ from .protocol import InverterProtocol, ProtocolCommand, ProtocolResponse, TcpIn
 
 logger = logging.getLogger(__name__)
 
+# Printable ascii characters, data consisting solely of them can be decoded directly
+_PRINTABLE_ASCII = bytes(range(32, 127))
+# All but control characters, data with anything left after deleting them are considered utf-16
+_NON_CONTROL = bytes(range(32, 256))
+
 
 class SensorKind(Enum):
     """
@@ -38,6 +44,8 @@ class SensorKind(Enum):
 class Sensor:
     """Definition of inverter sensor and its attributes"""
 
+    __slots__ = ('id_', 'offset', 'name', 'size_', 'unit', 'kind', '_is_pv34', '_is_phase23')
+
     id_: str
     offset: int
     name: str
@@ -45,6 +53,21 @@ class Sensor:
     unit: str
     kind: Optional[SensorKind]
 
+    # Struct format of the fixed size numeric raw value (if any), such sensors can be decoded in bulk
+    _fmt = None
+    # Pre-compiled (big-endian) struct of the _fmt format
+    _struct = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '_fmt' in cls.__dict__:
+            cls._struct = Struct('>' + cls._fmt) if cls._fmt else None
+
+    def __post_init__(self):
+        # Sensor id traits used to filter out sensors not present on particular inverter variants
+        self._is_pv34: bool = 'pv3' in self.id_ or 'pv4' in self.id_
+        self._is_phase23: bool = self.id_[-1:] in ('2', '3') and 'pv' not in self.id_
+
     def read_value(self, data: ProtocolResponse) -> Any:
         """Read the sensor value from data at current position"""
         raise NotImplementedError()
@@ -52,13 +75,65 @@ class Sensor:
     def read(self, data: ProtocolResponse) -> Any:
         """Read the sensor value from data (at sensor offset)"""
         data.seek(self.offset)
+        if self._struct is not None:
+            values = data.unpack(self._struct)
+            if values is not None:
+                return self.decode_raw(values[0])
         return self.read_value(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        """Decode the sensor value from raw value unpacked with sensor's struct format"""
+        return value
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         """Encode the (setting mostly) value to (usually) 2 bytes raw register value"""
         raise NotImplementedError()
 
 
+class DecodePlan:
+    """
+    Plan of decoding the sensors values from response of particular protocol command.
+    The sensors with fixed size numeric values are unpacked all at once with single pre-compiled struct,
+    the remaining (overlapping or calculated) sensors are read one by one.
+    """
+
+    def __init__(self, sensors: tuple[Sensor, ...], command: ProtocolCommand | None):
+        self.sensors: tuple[Sensor, ...] = sensors
+        self._blank: dict[str, Any] = dict.fromkeys(s.id_ for s in sensors)
+        bulk = []
+        fmt = '>'
+        end = 0
+        for sensor in sorted((s for s in sensors if s._fmt), key=lambda s: s.offset):
+            start = command.get_offset(sensor.offset) if command is not None else sensor.offset
+            if start < end:
+                continue
+            if start > end:
+                fmt += f'{start - end}x'
+            fmt += sensor._fmt
+            end = start + calcsize(sensor._fmt)
+            bulk.append(sensor)
+        bulk_ids = {id(s) for s in bulk}
+        self._bulk: tuple[Sensor, ...] = tuple(bulk)
+        self._others: tuple[Sensor, ...] = tuple(s for s in sensors if id(s) not in bulk_ids)
+        self._struct: Struct = Struct(fmt)
+
+    def decode(self, response: ProtocolResponse, result: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Process the response data and store sensor values into (optionally provided) result dictionary"""
+        if result is None:
+            result = {}
+        data = response.response_data()
+        if len(data) < self._struct.size:
+            # truncated response, read the sensors one by one
+            return Inverter._map_response(response, self.sensors, result)
+        # reserve the keys in sensors order, the bulk sensors are unpacked in offset order
+        result.update(self._blank)
+        for sensor, value in zip(self._bulk, self._struct.unpack_from(data)):
+            result[sensor.id_] = sensor.decode_raw(value)
+        if self._others:
+            Inverter._map_response(response, self._others, result)
+        return result
+
+
 class OperationMode(IntEnum):
     """
     Enumeration of sensor kinds.
@@ -92,6 +167,8 @@ class Inverter(ABC):
     def __init__(self, host: str, port: int, comm_addr: int = 0, timeout: int = 1, retries: int = 3):
         self._protocol: InverterProtocol = self._create_protocol(host, port, comm_addr, timeout, retries)
         self._consecutive_failures_count: int = 0
+        self._decode_plans: dict[ProtocolCommand | None, DecodePlan] = {}
+        self._read_commands: dict[tuple[int, int], ProtocolCommand] = {}
 
         self.model_name: str | None = None
         self.serial_number: str | None = None
@@ -107,8 +184,11 @@ class Inverter(ABC):
         self.arm_svn_version: int | None = None
 
     def _read_command(self, offset: int, count: int) -> ProtocolCommand:
-        """Create read protocol command."""
-        return self._protocol.read_command(offset, count)
+        """Create read protocol command (cached, the request bytes depend only on offset and count)."""
+        command = self._read_commands.get((offset, count))
+        if command is None:
+            command = self._read_commands[(offset, count)] = self._protocol.read_command(offset, count)
+        return command
 
     def _write_command(self, register: int, value: int) -> ProtocolCommand:
         """Create write protocol command."""
@@ -286,9 +366,11 @@ class Inverter(ABC):
         return UdpInverterProtocol(host, port, comm_addr, timeout, retries)
 
     @staticmethod
-    def _map_response(response: ProtocolResponse, sensors: tuple[Sensor, ...]) -> dict[str, Any]:
-        """Process the response data and return dictionary with runtime values"""
-        result = {}
+    def _map_response(response: ProtocolResponse, sensors: tuple[Sensor, ...],
+                      result: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Process the response data and store runtime values into (optionally provided) result dictionary"""
+        if result is None:
+            result = {}
         for sensor in sensors:
             try:
                 result[sensor.id_] = sensor.read(response)
@@ -297,11 +379,22 @@ class Inverter(ABC):
                 result[sensor.id_] = None
         return result
 
+    def _decode_response(self, response: ProtocolResponse, sensors: tuple[Sensor, ...],
+                         result: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Process the response data and return dictionary with runtime values (using cached decode plan)"""
+        plan = self._decode_plans.get(response.command)
+        if plan is None or plan.sensors is not sensors:
+            plan = DecodePlan(sensors, response.command)
+            self._decode_plans[response.command] = plan
+        return plan.decode(response, result)
+
     @staticmethod
     def _decode(data: bytes) -> str:
         """Decode the bytes to ascii string"""
+        if not data.translate(None, _PRINTABLE_ASCII):
+            return data.decode("ascii").rstrip()
         try:
-            if any(x < 32 for x in data):
+            if data.translate(None, _NON_CONTROL):
                 return data.decode("utf-16be").rstrip().replace('\x00', '')
             return data.decode("ascii").rstrip()
         except ValueError:
@@ -1,8 +1,9 @@
 """Modbus protocol implementation."""
 import logging
+from struct import Struct
 from typing import Union
 
-from .exceptions import PartialResponseException, RequestRejectedException
+from .exceptions import IllegalDataAddressException, PartialResponseException, RequestRejectedException
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,15 @@ def _create_crc16_table() -> tuple:
 
 _CRC_16_TABLE = _create_crc16_table()
 
+_RTU_REQUEST = Struct(">BBHH")
+_RTU_MULTI_REQUEST = Struct(">BBHHB")
+_TCP_REQUEST = Struct(">HHHBBHH")
+_TCP_MULTI_REQUEST = Struct(">HHHBBHHB")
+# Command type and payload length (of read) or register offset and value (of write) of response
+_RESPONSE_HEADER = Struct(">BB")
+_WRITE_RESPONSE = Struct(">Hh")
+_RTU_CRC = Struct("<H")
+
 
 def _modbus_checksum(data: Union[bytearray, bytes]) -> int:
     """
@@ -64,17 +74,8 @@ def create_modbus_rtu_request(comm_addr: int, cmd: int, offset: int, value: int)
     data[4:5] is command value parameter
     data[6:7] is crc-16 checksum
     """
-    data: bytearray = bytearray(6)
-    data[0] = comm_addr
-    data[1] = cmd
-    data[2] = (offset >> 8) & 0xFF
-    data[3] = offset & 0xFF
-    data[4] = (value >> 8) & 0xFF
-    data[5] = value & 0xFF
-    checksum = _modbus_checksum(data)
-    data.append(checksum & 0xFF)
-    data.append((checksum >> 8) & 0xFF)
-    return bytes(data)
+    data = _RTU_REQUEST.pack(comm_addr, cmd, offset & 0xFFFF, value & 0xFFFF)
+    return data + _modbus_checksum(data).to_bytes(2, byteorder='little')
 
 
 def create_modbus_tcp_request(comm_addr: int, cmd: int, offset: int, value: int) -> bytes:
@@ -88,20 +89,8 @@ def create_modbus_tcp_request(comm_addr: int, cmd: int, offset: int, value: int)
     data[8:9] is command offset parameter
     data[10:11] is command value parameter
     """
-    data: bytearray = bytearray(12)
-    data[0] = 0
-    data[1] = 1  # Not transaction ID support yet
-    data[2] = 0
-    data[3] = 0
-    data[4] = 0
-    data[5] = 6
-    data[6] = comm_addr
-    data[7] = cmd
-    data[8] = (offset >> 8) & 0xFF
-    data[9] = offset & 0xFF
-    data[10] = (value >> 8) & 0xFF
-    data[11] = value & 0xFF
-    return bytes(data)
+    # Not transaction ID support yet
+    return _TCP_REQUEST.pack(1, 0, 6, comm_addr, cmd, offset & 0xFFFF, value & 0xFFFF)
 
 
 def create_modbus_rtu_multi_request(comm_addr: int, cmd: int, offset: int, values: bytes) -> bytes:
@@ -115,19 +104,8 @@ def create_modbus_rtu_multi_request(comm_addr: int, cmd: int, offset: int, value
     data[7-n] is data payload
     data[n+1:n+2] is crc-16 checksum
     """
-    data: bytearray = bytearray(7)
-    data[0] = comm_addr
-    data[1] = cmd
-    data[2] = (offset >> 8) & 0xFF
-    data[3] = offset & 0xFF
-    data[4] = 0
-    data[5] = len(values) // 2
-    data[6] = len(values)
-    data.extend(values)
-    checksum = _modbus_checksum(data)
-    data.append(checksum & 0xFF)
-    data.append((checksum >> 8) & 0xFF)
-    return bytes(data)
+    data = _RTU_MULTI_REQUEST.pack(comm_addr, cmd, offset & 0xFFFF, len(values) // 2, len(values)) + values
+    return data + _modbus_checksum(data).to_bytes(2, byteorder='little')
 
 
 def create_modbus_tcp_multi_request(comm_addr: int, cmd: int, offset: int, values: bytes) -> bytes:
@@ -143,22 +121,30 @@ def create_modbus_tcp_multi_request(comm_addr: int, cmd: int, offset: int, value
     data[12] is number of bytes
     data[13-n] is data payload
     """
-    data: bytearray = bytearray(13)
-    data[0] = 0
-    data[1] = 1  # Not transaction ID support yet
-    data[2] = 0
-    data[3] = 0
-    data[4] = 0
-    data[5] = 7 + len(values)
-    data[6] = comm_addr
-    data[7] = cmd
-    data[8] = (offset >> 8) & 0xFF
-    data[9] = offset & 0xFF
-    data[10] = 0
-    data[11] = len(values) // 2
-    data[12] = len(values)
-    data.extend(values)
-    return bytes(data)
+    # Not transaction ID support yet
+    return _TCP_MULTI_REQUEST.pack(1, 0, 7 + len(values), comm_addr, cmd, offset & 0xFFFF, len(values) // 2,
+                                   len(values)) + values
+
+
+def _validate_write_response(data: bytes, position: int, offset: int, value: int) -> bool:
+    """Validate the register offset and value echoed in (modbus) write command response"""
+    response_offset, response_value = _WRITE_RESPONSE.unpack_from(data, position)
+    if response_offset != offset:
+        logger.debug("Response has wrong offset: %X, expected %X.", response_offset, offset)
+        return False
+    if response_value != value:
+        logger.debug("Response has wrong value: %X, expected %X.", response_value, value)
+        return False
+    return True
+
+
+def _raise_command_failure(code: int) -> None:
+    """Raise exception corresponding to the modbus command failure (exception) code"""
+    failure_code = FAILURE_CODES.get(code, "UNKNOWN")
+    logger.debug("Response is command failure: %s.", failure_code)
+    if failure_code == ILLEGAL_DATA_ADDRESS:
+        raise IllegalDataAddressException(failure_code)
+    raise RequestRejectedException(failure_code)
 
 
 def validate_modbus_rtu_response(data: bytes, cmd: int, offset: int, value: int) -> bool:
@@ -173,38 +159,31 @@ def validate_modbus_rtu_response(data: bytes, cmd: int, offset: int, value: int)
     if len(data) <= 4:
         logger.debug("Response is too short.")
         return False
-    if data[3] == MODBUS_READ_CMD:
-        if data[4] != value * 2:
-            logger.debug("Response has unexpected length: %d, expected %d.", data[4], value * 2)
+    response_cmd, response_length = _RESPONSE_HEADER.unpack_from(data, 3)
+    if response_cmd == MODBUS_READ_CMD:
+        if response_length != value * 2:
+            logger.debug("Response has unexpected length: %d, expected %d.", response_length, value * 2)
             return False
-        expected_length = data[4] + 7
+        expected_length = response_length + 7
         if len(data) < expected_length:
             raise PartialResponseException(len(data), expected_length)
-    elif data[3] in (MODBUS_WRITE_CMD, MODBUS_WRITE_MULTI_CMD):
+    elif response_cmd in (MODBUS_WRITE_CMD, MODBUS_WRITE_MULTI_CMD):
         if len(data) < 10:
             logger.debug("Response has unexpected length: %d, expected %d.", len(data), 10)
             return False
         expected_length = 10
-        response_offset = int.from_bytes(data[4:6], byteorder='big', signed=False)
-        if response_offset != offset:
-            logger.debug("Response has wrong offset: %X, expected %X.", response_offset, offset)
-            return False
-        response_value = int.from_bytes(data[6:8], byteorder='big', signed=True)
-        if response_value != value:
-            logger.debug("Response has wrong value: %X, expected %X.", response_value, value)
+        if not _validate_write_response(data, 4, offset, value):
             return False
     else:
         expected_length = len(data)
 
     checksum_offset = expected_length - 2
-    if _modbus_checksum(data[2:checksum_offset]) != ((data[checksum_offset + 1] << 8) + data[checksum_offset]):
+    if _modbus_checksum(data[2:checksum_offset]) != _RTU_CRC.unpack_from(data, checksum_offset)[0]:
         logger.debug("Response CRC-16 checksum does not match.")
         return False
 
-    if data[3] != cmd:
-        failure_code = FAILURE_CODES.get(data[4], "UNKNOWN")
-        logger.debug("Response is command failure: %s.", FAILURE_CODES.get(data[4], "UNKNOWN"))
-        raise RequestRejectedException(failure_code)
+    if response_cmd != cmd:
+        _raise_command_failure(response_length)
 
     return True
 
@@ -228,29 +207,22 @@ def validate_modbus_tcp_response(data: bytes, cmd: int, offset: int, value: int)
     # if len(data) < expected_length:
     #    raise PartialResponseException(len(data), expected_length)
 
-    if data[7] == MODBUS_READ_CMD:
-        expected_length = data[8] + 9
+    response_cmd, response_length = _RESPONSE_HEADER.unpack_from(data, 7)
+    if response_cmd == MODBUS_READ_CMD:
+        expected_length = response_length + 9
         if len(data) < expected_length:
             raise PartialResponseException(len(data), expected_length)
-        if data[8] != value * 2:
-            logger.debug("Response has unexpected length: %d, expected %d.", data[8], value * 2)
+        if response_length != value * 2:
+            logger.debug("Response has unexpected length: %d, expected %d.", response_length, value * 2)
             return False
-    elif data[7] in (MODBUS_WRITE_CMD, MODBUS_WRITE_MULTI_CMD):
+    elif response_cmd in (MODBUS_WRITE_CMD, MODBUS_WRITE_MULTI_CMD):
         if len(data) < 12:
             logger.debug("Response has unexpected length: %d, expected %d.", len(data), 12)
             return False
-        response_offset = int.from_bytes(data[8:10], byteorder='big', signed=False)
-        if response_offset != offset:
-            logger.debug("Response has wrong offset: %X, expected %X.", response_offset, offset)
-            return False
-        response_value = int.from_bytes(data[10:12], byteorder='big', signed=True)
-        if response_value != value:
-            logger.debug("Response has wrong value: %X, expected %X.", response_value, value)
+        if not _validate_write_response(data, 8, offset, value):
             return False
 
-    if data[7] != cmd:
-        failure_code = FAILURE_CODES.get(data[8], "UNKNOWN")
-        logger.debug("Response is command failure: %s.", FAILURE_CODES.get(data[8], "UNKNOWN"))
-        raise RequestRejectedException(failure_code)
+    if response_cmd != cmd:
+        _raise_command_failure(response_length)
 
     return True
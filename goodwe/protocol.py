@@ -2,12 +2,16 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import ipaddress
 import logging
 import platform
+import random
 import socket
+import time
 from asyncio.futures import Future
-from typing import Optional, Callable
+from contextlib import asynccontextmanager
+from struct import Struct
+from typing import AsyncIterator, Optional, Callable
 
 from .exceptions import MaxRetriesException, PartialResponseException, RequestFailedException, RequestRejectedException
 from .modbus import create_modbus_rtu_request, create_modbus_rtu_multi_request, create_modbus_tcp_request, \
@@ -16,6 +20,18 @@ from .modbus import create_modbus_rtu_request, create_modbus_rtu_multi_request,
 
 logger = logging.getLogger(__name__)
 
+BROADCAST_ADDRESS: str = "255.255.255.255"
+
+# Initial and maximal delay (in seconds) of the exponential backoff of retries failing immediately (e.g. refused)
+_RETRY_BACKOFF_BASE = 0.2
+_RETRY_BACKOFF_MAX = 2.0
+
+# Time (in seconds) the resolved host address is re-used before it is resolved again (e.g. to follow DHCP changes)
+_RESOLVE_CACHE_TTL = 300
+
+# Response type and checksum fields of AA55 response
+_AA55_INT16 = Struct(">h")
+
 _modbus_tcp_tx = 0
 
 
@@ -39,6 +55,7 @@ class InverterProtocol:
         self.timeout: int = timeout
         self.retries: int = retries
         self.keep_alive: bool = False
+        self._sessions: int = 0
         self.protocol: asyncio.Protocol | None = None
         self.response_future: Future | None = None
         self.command: ProtocolCommand | None = None
@@ -69,6 +86,24 @@ class InverterProtocol:
         self.response_future.set_exception(MaxRetriesException)
         return self.response_future
 
+    def _retry_delay(self) -> float:
+        """Answer the (exponential backoff with jitter) delay before the current retry"""
+        return min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * 2 ** (self._retry - 1)) + random.uniform(0, 0.05)
+
+    def _abort_request(self, response_future: Future | None) -> bool:
+        """
+        Check if the request itself (e.g. its task) was cancelled, not just its response future due to timeout.
+        If so, discard the pending response future and timer, since no retry will follow.
+        """
+        if response_future is not None and response_future.done():
+            return False
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if response_future is not None:
+            response_future.cancel()
+        return True
+
     def _close_transport(self) -> None:
         if self._transport:
             try:
@@ -84,6 +119,26 @@ class InverterProtocol:
         """Close the underlying transport/connection."""
         raise NotImplementedError()
 
+    def _keep_connection(self) -> bool:
+        """Answer if the connection should be kept open after request (keep_alive is set or session is open)"""
+        return self.keep_alive or self._sessions > 0
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        """
+        Keep the connection (UDP socket or TCP connection) open for all requests executed within this context,
+        e.g. a single poll cycle.
+        Sessions may be nested or overlapping, the connection is closed when the last one is left
+        (unless keep_alive is set). The close waits for the request in progress (if any) to complete.
+        """
+        self._sessions += 1
+        try:
+            yield
+        finally:
+            self._sessions -= 1
+            if not self._keep_connection():
+                await self.close()
+
     async def send_request(self, command: ProtocolCommand) -> Future:
         """Convert command to request and send it to inverter."""
         raise NotImplementedError()
@@ -106,6 +161,26 @@ class UdpInverterProtocol(InverterProtocol, asyncio.DatagramProtocol):
         super().__init__(host, port, comm_addr, timeout, retries)
         self._transport: asyncio.transports.DatagramTransport | None = None
         self._retry: int = 0
+        self._address: tuple[str, float] | None = None
+
+    async def _resolve_host(self) -> str:
+        """
+        Resolve the host name to IP address (of datagram socket).
+        The resolved address is cached, so the (possibly slow) DNS lookup is not repeated on every (re)connect.
+        The cache is dropped when the address cannot be connected or the inverter stops responding.
+        """
+        try:
+            ipaddress.ip_address(self._host)
+            return self._host
+        except ValueError:
+            pass
+        if self._address and time.monotonic() - self._address[1] < _RESOLVE_CACHE_TTL:
+            return self._address[0]
+        addr_info = await asyncio.get_running_loop().getaddrinfo(self._host, self._port, type=socket.SOCK_DGRAM)
+        address = addr_info[0][4][0]
+        logger.debug("Resolved host %s to %s.", self._host, address)
+        self._address = (address, time.monotonic())
+        return address
 
     def read_command(self, offset: int, count: int) -> ProtocolCommand:
         """Create read protocol command."""
@@ -121,10 +196,15 @@ class UdpInverterProtocol(InverterProtocol, asyncio.DatagramProtocol):
 
     async def _connect(self) -> None:
         if not self._transport or self._transport.is_closing():
-            self._transport, self.protocol = await asyncio.get_running_loop().create_datagram_endpoint(
-                lambda: self,
-                remote_addr=(self._host, self._port),
-            )
+            try:
+                self._transport, self.protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+                    lambda: self,
+                    remote_addr=(await self._resolve_host(), self._port),
+                    allow_broadcast=self._host == BROADCAST_ADDRESS,
+                )
+            except OSError:
+                self._address = None
+                raise
 
     def connection_made(self, transport: asyncio.DatagramTransport) -> None:
         """On connection made"""
@@ -178,25 +258,32 @@ class UdpInverterProtocol(InverterProtocol, asyncio.DatagramProtocol):
     async def send_request(self, command: ProtocolCommand) -> Future:
         """Send message via transport"""
         await self._ensure_lock().acquire()
+        response_future = None
         try:
             await self._connect()
             response_future = asyncio.get_running_loop().create_future()
             self._send_request(command, response_future)
-            await response_future
+            # the response future is cancelled on timeout, shield it to tell apart cancellation of the request itself
+            await asyncio.shield(response_future)
             return response_future
         except asyncio.CancelledError:
+            if self._abort_request(response_future):
+                raise
             if self._retry < self.retries:
                 self._retry += 1
                 if self._lock and self._lock.locked():
                     self._lock.release()
-                if not self.keep_alive:
-                    self._close_transport()
+                # always retry on new socket (even when kept alive), so late response to the timed out request
+                # cannot be mistaken for response to the retried (or next) request
+                self._close_transport()
                 return await self.send_request(command)
+            # the inverter does not respond (anymore), its address may have changed
+            self._address = None
             return self._max_retries_reached()
         finally:
             if self._lock and self._lock.locked():
                 self._lock.release()
-            if not self.keep_alive:
+            if not self._keep_connection():
                 self._close_transport()
 
     def _send_request(self, command: ProtocolCommand, response_future: Future) -> None:
@@ -226,7 +313,12 @@ class UdpInverterProtocol(InverterProtocol, asyncio.DatagramProtocol):
                 self.response_future.cancel()
 
     async def close(self):
-        self._close_transport()
+        await self._ensure_lock().acquire()
+        try:
+            self._close_transport()
+        finally:
+            if self._lock and self._lock.locked():
+                self._lock.release()
 
 
 class TcpInverterProtocol(InverterProtocol, asyncio.Protocol):
@@ -323,13 +415,17 @@ class TcpInverterProtocol(InverterProtocol, asyncio.Protocol):
     async def send_request(self, command: ProtocolCommand) -> Future:
         """Send message via transport"""
         await self._ensure_lock().acquire()
+        response_future = None
         try:
             await asyncio.wait_for(self._connect(), timeout=5)
             response_future = asyncio.get_running_loop().create_future()
             self._send_request(command, response_future)
-            await response_future
+            # the response future is cancelled on timeout, shield it to tell apart cancellation of the request itself
+            await asyncio.shield(response_future)
             return response_future
         except asyncio.CancelledError:
+            if self._abort_request(response_future):
+                raise
             if self._retry < self.retries:
                 if self._timer:
                     logger.debug("Connection broken error.")
@@ -345,6 +441,7 @@ class TcpInverterProtocol(InverterProtocol, asyncio.Protocol):
                 self._retry += 1
                 if self._lock and self._lock.locked():
                     self._lock.release()
+                await asyncio.sleep(self._retry_delay())
                 return await self.send_request(command)
             return self._max_retries_reached()
         finally:
@@ -390,24 +487,33 @@ class ProtocolResponse:
     def __init__(self, raw_data: bytes, command: Optional[ProtocolCommand]):
         self.raw_data: bytes = raw_data
         self.command: ProtocolCommand = command
-        self._bytes: io.BytesIO = io.BytesIO(self.response_data())
+        self._data: bytes = command.trim_response(raw_data) if command is not None else raw_data
+        self._position: int = 0
 
     def __repr__(self):
         return self.raw_data.hex()
 
     def response_data(self) -> bytes:
-        if self.command is not None:
-            return self.command.trim_response(self.raw_data)
-        return self.raw_data
+        return self._data
 
     def seek(self, address: int) -> None:
-        if self.command is not None:
-            self._bytes.seek(self.command.get_offset(address))
-        else:
-            self._bytes.seek(address)
+        position = self.command.get_offset(address) if self.command is not None else address
+        if position < 0:
+            raise ValueError(f"negative seek value {position}")
+        self._position = position
 
     def read(self, size: int) -> bytes:
-        return self._bytes.read(size)
+        data = self._data[self._position:self._position + size]
+        self._position += len(data)
+        return data
+
+    def unpack(self, fmt: Struct) -> tuple | None:
+        """Unpack the values of (pre-compiled) struct at current position, None if the data are not long enough"""
+        position = self._position
+        if position + fmt.size > len(self._data):
+            return None
+        self._position = position + fmt.size
+        return fmt.unpack_from(self._data, position)
 
 
 class ProtocolCommand:
@@ -445,7 +551,10 @@ class ProtocolCommand:
         """
         Execute the protocol command on the specified connection.
 
-        Return ProtocolResponse with raw response data
+        Return ProtocolResponse with raw response data.
+        Raise RequestFailedException (or its subclass) when no valid response is received.
+        Cancellation of the calling task is not converted to RequestFailedException, asyncio.CancelledError is raised
+        (the request is aborted and the protocol lock released).
         """
         try:
             response_future = await protocol.send_request(self)
@@ -455,12 +564,12 @@ class ProtocolCommand:
             raise RequestFailedException(
                 "No response received to '" + self.request.hex() + "' request."
             )
-        except (asyncio.CancelledError, ConnectionRefusedError):
+        except ConnectionRefusedError:
             raise RequestFailedException(
                 "No valid response received to '" + self.request.hex() + "' request."
             ) from None
         finally:
-            if not protocol.keep_alive:
+            if not protocol._keep_connection():
                 await protocol.close()
 
 
@@ -480,26 +589,21 @@ class Aa55ProtocolCommand(ProtocolCommand):
     """
 
     def __init__(self, payload: str, response_type: str, offset: int = 0, value: int = 0):
+        request = bytes.fromhex("AA55C07F" + payload)
+        expected_type = int(response_type, 16) if response_type else None
         super().__init__(
-            bytes.fromhex(
-                "AA55C07F"
-                + payload
-                + self._checksum(bytes.fromhex("AA55C07F" + payload)).hex()
-            ),
-            lambda x: self._validate_aa55_response(x, response_type),
+            request + self._checksum(request),
+            lambda x: self._validate_aa55_response(x, expected_type),
         )
         self.first_address: int = offset
         self.value = value
 
     @staticmethod
     def _checksum(data: bytes) -> bytes:
-        checksum = 0
-        for each in data:
-            checksum += each
-        return checksum.to_bytes(2, byteorder="big", signed=False)
+        return sum(data).to_bytes(2, byteorder="big", signed=False)
 
     @staticmethod
-    def _validate_aa55_response(data: bytes, response_type: str) -> bool:
+    def _validate_aa55_response(data: bytes, response_type: int | None) -> bool:
         """
         Validate the response.
         data[0:3] is header
@@ -515,16 +619,13 @@ class Aa55ProtocolCommand(ProtocolCommand):
         elif len(data) > data[6] + 9:
             logger.debug("Response invalid - too long (%d).", len(data))
             return False
-        elif response_type:
-            data_rt_int = int.from_bytes(data[4:6], byteorder="big", signed=True)
-            if int(response_type, 16) != data_rt_int:
-                logger.debug("Response type unexpected: %04x, expected %s.", data_rt_int, response_type)
+        elif response_type is not None:
+            data_rt_int = _AA55_INT16.unpack_from(data, 4)[0]
+            if response_type != data_rt_int:
+                logger.debug("Response type unexpected: %04x, expected %04x.", data_rt_int, response_type)
                 return False
 
-        checksum = 0
-        for each in data[:-2]:
-            checksum += each
-        if checksum != int.from_bytes(data[-2:], byteorder="big", signed=True):
+        if sum(data[:-2]) != _AA55_INT16.unpack_from(data, len(data) - 2)[0]:
             logger.debug("Response checksum does not match.")
             return False
         return True
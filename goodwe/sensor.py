@@ -4,7 +4,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import IntEnum
-from struct import unpack
+from struct import Struct
 from typing import Any, Callable, Optional
 
 from .inverter import Sensor, SensorKind
@@ -13,6 +13,20 @@ from .protocol import ProtocolResponse
 DAY_NAMES = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
 MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
+# Pre-compiled (big endian) struct formats of the raw values
+_INT8 = Struct(">b")
+_UINT16 = Struct(">H")
+_INT16 = Struct(">h")
+_UINT32 = Struct(">I")
+_INT32 = Struct(">i")
+_UINT64 = Struct(">Q")
+_FLOAT32 = Struct(">f")
+_DATETIME = Struct(">6B")
+_VOLTAGE_CURRENT = Struct(">HH")
+
+# Empty and disabled eco mode (V1) group
+_ECO_MODE_V1_OFF = bytes.fromhex("3000300000640000")
+
 
 class ScheduleType(IntEnum):
     ECO_MODE = 0
@@ -84,12 +98,18 @@ class ScheduleType(IntEnum):
 class Voltage(Sensor):
     """Sensor representing voltage [V] value encoded in 2 (unsigned) bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "V", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_voltage(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 10 if value != 0xffff else 0
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return encode_voltage(value)
 
@@ -97,12 +117,18 @@ class Voltage(Sensor):
 class Current(Sensor):
     """Sensor representing current [A] value encoded in 2 (unsigned) bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "A", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_current(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 10 if value != 0xffff else 0
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return encode_current(value)
 
@@ -110,12 +136,18 @@ class Current(Sensor):
 class CurrentS(Sensor):
     """Sensor representing current [A] value encoded in 2 (signed) bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "A", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_current_signed(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 10
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return encode_current_signed(value)
 
@@ -123,26 +155,41 @@ class CurrentS(Sensor):
 class Frequency(Sensor):
     """Sensor representing frequency [Hz] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "Hz", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_freq(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 100
+
 
 class Power(Sensor):
     """Sensor representing power [W] value encoded in 2 (unsigned) bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "W", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_bytes2(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return value if value != 0xffff else None
+
 
 class PowerS(Sensor):
     """Sensor representing power [W] value encoded in 2 (signed) bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "W", kind)
 
@@ -153,16 +200,25 @@ class PowerS(Sensor):
 class Power4(Sensor):
     """Sensor representing power [W] value encoded in 4 (unsigned) bytes"""
 
+    __slots__ = ()
+    _fmt = 'I'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 4, "W", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_bytes4(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return value if value != 0xffffffff else None
+
 
 class Power4S(Sensor):
     """Sensor representing power [W] value encoded in 4 (signed) bytes"""
 
+    __slots__ = ()
+    _fmt = 'i'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 4, "W", kind)
 
@@ -173,6 +229,9 @@ class Power4S(Sensor):
 class Energy(Sensor):
     """Sensor representing energy [kWh] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "kWh", kind)
 
@@ -180,10 +239,16 @@ class Energy(Sensor):
         value = read_bytes2(data)
         return float(value) / 10 if value is not None else None
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 10 if value != 0xffff else None
+
 
 class Energy4(Sensor):
     """Sensor representing energy [kWh] value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'I'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 4, "kWh", kind)
 
@@ -191,10 +256,16 @@ class Energy4(Sensor):
         value = read_bytes4(data)
         return float(value) / 10 if value is not None else None
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 10 if value != 0xffffffff else None
+
 
 class Energy4W(Sensor):
     """Sensor representing meter energy [kWh] value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'I'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 4, "kWh", kind)
 
@@ -202,10 +273,16 @@ class Energy4W(Sensor):
         value = read_bytes4(data)
         return float(value) / 1000 if value is not None else None
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 1000 if value != 0xffffffff else None
+
 
 class Energy8(Sensor):
     """Sensor representing energy [kWh] value encoded in 8 bytes"""
 
+    __slots__ = ()
+    _fmt = 'Q'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 8, "kWh", kind)
 
@@ -213,10 +290,16 @@ class Energy8(Sensor):
         value = read_bytes8(data)
         return float(value) / 100 if value is not None else None
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / 100 if value != 0xffffffffffffffff else None
+
 
 class Apparent(Sensor):
     """Sensor representing apparent power [VA] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "VA", kind)
 
@@ -227,6 +310,9 @@ class Apparent(Sensor):
 class Apparent4(Sensor):
     """Sensor representing apparent power [VA] value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'i'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "VA", kind)
 
@@ -237,6 +323,9 @@ class Apparent4(Sensor):
 class Reactive(Sensor):
     """Sensor representing reactive power [var] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "var", kind)
 
@@ -247,6 +336,9 @@ class Reactive(Sensor):
 class Reactive4(Sensor):
     """Sensor representing reactive power [var] value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'i'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "var", kind)
 
@@ -257,26 +349,41 @@ class Reactive4(Sensor):
 class Temp(Sensor):
     """Sensor representing temperature [C] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 2, "C", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_temp(data)
 
+    def decode_raw(self, value: Any) -> Any:
+        return None if value in (-1, 32767) else float(value) / 10
+
 
 class CellVoltage(Sensor):
     """Sensor representing battery cell voltage [V] value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind]):
         super().__init__(id_, offset, name, 2, "V", kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_voltage(data) / 100
 
+    def decode_raw(self, value: Any) -> Any:
+        return (float(value) / 10 if value != 0xffff else 0) / 100
+
 
 class Byte(Sensor):
     """Sensor representing signed int value encoded in 1 byte"""
 
+    __slots__ = ()
+    _fmt = 'b'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 1, unit, kind)
 
@@ -290,6 +397,8 @@ class Byte(Sensor):
 class ByteH(Byte):
     """Sensor representing signed int value encoded in 1 byte (high 8 bits of 16bit register)"""
 
+    __slots__ = ()
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, unit, kind)
 
@@ -305,6 +414,9 @@ class ByteH(Byte):
 class ByteL(Byte):
     """Sensor representing signed int value encoded in 1 byte (low 8 bits of 16bit register)"""
 
+    __slots__ = ()
+    _fmt = 'xb'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, unit, kind)
 
@@ -321,12 +433,18 @@ class ByteL(Byte):
 class Integer(Sensor):
     """Sensor representing unsigned int value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 2, unit, kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_bytes2(data, None, 0)
 
+    def decode_raw(self, value: Any) -> Any:
+        return value if value != 0xffff else 0
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return int.to_bytes(int(value), length=2, byteorder="big", signed=False)
 
@@ -334,6 +452,9 @@ class Integer(Sensor):
 class IntegerS(Sensor):
     """Sensor representing signed int value encoded in 2 bytes"""
 
+    __slots__ = ()
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 2, unit, kind)
 
@@ -347,12 +468,18 @@ class IntegerS(Sensor):
 class Long(Sensor):
     """Sensor representing unsigned int value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'I'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 4, unit, kind)
 
     def read_value(self, data: ProtocolResponse):
         return read_bytes4(data, None, 0)
 
+    def decode_raw(self, value: Any) -> Any:
+        return value if value != 0xffffffff else 0
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return int.to_bytes(int(value), length=4, byteorder="big", signed=False)
 
@@ -360,6 +487,9 @@ class Long(Sensor):
 class LongS(Sensor):
     """Sensor representing signed int value encoded in 4 bytes"""
 
+    __slots__ = ()
+    _fmt = 'i'
+
     def __init__(self, id_: str, offset: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 4, unit, kind)
 
@@ -373,6 +503,9 @@ class LongS(Sensor):
 class Decimal(Sensor):
     """Sensor representing signed decimal value encoded in 2 bytes"""
 
+    __slots__ = ('scale',)
+    _fmt = 'h'
+
     def __init__(self, id_: str, offset: int, scale: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 2, unit, kind)
         self.scale = scale
@@ -380,6 +513,9 @@ class Decimal(Sensor):
     def read_value(self, data: ProtocolResponse):
         return read_decimal2(data, self.scale)
 
+    def decode_raw(self, value: Any) -> Any:
+        return float(value) / self.scale
+
     def encode_value(self, value: Any, register_value: bytes = None) -> bytes:
         return int.to_bytes(int(float(value) * self.scale), length=2, byteorder="big", signed=True)
 
@@ -387,6 +523,9 @@ class Decimal(Sensor):
 class Float(Sensor):
     """Sensor representing signed int value encoded in 4 bytes"""
 
+    __slots__ = ('scale',)
+    _fmt = 'f'
+
     def __init__(self, id_: str, offset: int, scale: int, name: str, unit: str = "", kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 4, unit, kind)
         self.scale = scale
@@ -394,10 +533,15 @@ class Float(Sensor):
     def read_value(self, data: ProtocolResponse):
         return round(read_float4(data) / self.scale, 3)
 
+    def decode_raw(self, value: Any) -> Any:
+        return round(value / self.scale, 3)
+
 
 class Timestamp(Sensor):
     """Sensor representing datetime value encoded in 6 bytes"""
 
+    __slots__ = ()
+
     def __init__(self, id_: str, offset: int, name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 6, "", kind)
 
@@ -411,6 +555,9 @@ class Timestamp(Sensor):
 class Enum(Sensor):
     """Sensor representing label from enumeration encoded in 1 bytes"""
 
+    __slots__ = ('_labels',)
+    _fmt = 'b'
+
     def __init__(self, id_: str, offset: int, labels: dict[int, str], name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 1, "", kind)
         self._labels: dict[int, str] = labels
@@ -418,10 +565,16 @@ class Enum(Sensor):
     def read_value(self, data: ProtocolResponse):
         return self._labels.get(read_byte(data))
 
+    def decode_raw(self, value: Any) -> Any:
+        return self._labels.get(value)
+
 
 class EnumH(Sensor):
     """Sensor representing label from enumeration encoded in 1 (high 8 bits of 16bit register)"""
 
+    __slots__ = ('_labels',)
+    _fmt = 'b'
+
     def __init__(self, id_: str, offset: int, labels: dict[int, str], name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 1, "", kind)
         self._labels: dict[int, str] = labels
@@ -429,10 +582,16 @@ class EnumH(Sensor):
     def read_value(self, data: ProtocolResponse):
         return self._labels.get(read_byte(data))
 
+    def decode_raw(self, value: Any) -> Any:
+        return self._labels.get(value)
+
 
 class EnumL(Sensor):
     """Sensor representing label from enumeration encoded in 1 byte (low 8 bits of 16bit register)"""
 
+    __slots__ = ('_labels',)
+    _fmt = 'xb'
+
     def __init__(self, id_: str, offset: int, labels: dict[int, str], name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 1, "", kind)
         self._labels: dict[int, str] = labels
@@ -441,10 +600,16 @@ class EnumL(Sensor):
         read_byte(data)
         return self._labels.get(read_byte(data))
 
+    def decode_raw(self, value: Any) -> Any:
+        return self._labels.get(value)
+
 
 class Enum2(Sensor):
     """Sensor representing label from enumeration encoded in 2 bytes"""
 
+    __slots__ = ('_labels',)
+    _fmt = 'H'
+
     def __init__(self, id_: str, offset: int, labels: dict[int, str], name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 2, "", kind)
         self._labels: dict[int, str] = labels
@@ -452,42 +617,53 @@ class Enum2(Sensor):
     def read_value(self, data: ProtocolResponse):
         return self._labels.get(read_bytes2(data, None, 0))
 
+    def decode_raw(self, value: Any) -> Any:
+        return self._labels.get(value if value != 0xffff else 0)
+
 
 class EnumBitmap4(Sensor):
     """Sensor representing label from bitmap encoded in 4 bytes"""
 
+    __slots__ = ('_labels', '_bit_labels')
+
     def __init__(self, id_: str, offset: int, labels: dict[int, str], name: str, kind: Optional[SensorKind] = None):
         super().__init__(id_, offset, name, 4, "", kind)
         self._labels: dict[int, str] = labels
+        self._bit_labels: tuple[str, ...] = _bit_labels(labels)
 
     def read_value(self, data: ProtocolResponse) -> Any:
         raise NotImplementedError()
 
     def read(self, data: ProtocolResponse):
         bits = read_bytes4_signed(data, self.offset)
-        return decode_bitmap(bits if bits != -1 else 0, self._labels)
+        return _decode_bits(bits if bits != -1 else 0, self._bit_labels)
 
 
 class EnumBitmap22(Sensor):
     """Sensor representing label from bitmap encoded in 2+2 bytes"""
 
+    __slots__ = ('_labels', '_bit_labels', '_offsetL')
+
     def __init__(self, id_: str, offsetH: int, offsetL: int, labels: dict[int, str], name: str,
                  kind: Optional[SensorKind] = None):
         super().__init__(id_, offsetH, name, 2, "", kind)
         self._labels: dict[int, str] = labels
+        self._bit_labels: tuple[str, ...] = _bit_labels(labels)
         self._offsetL: int = offsetL
 
     def read_value(self, data: ProtocolResponse) -> Any:
         raise NotImplementedError()
 
     def read(self, data: ProtocolResponse):
-        return decode_bitmap(read_bytes2(data, self.offset, 0) << 16 + read_bytes2(data, self._offsetL, 0),
-                             self._labels)
+        return _decode_bits((read_bytes2(data, self.offset, 0) << 16) + read_bytes2(data, self._offsetL, 0),
+                            self._bit_labels)
 
 
 class EnumCalculated(Sensor):
     """Sensor representing label from enumeration of calculated value"""
 
+    __slots__ = ('_getter', '_labels')
+
     def __init__(self, id_: str, getter: Callable[[ProtocolResponse], Any], labels: dict[int, str], name: str,
                  kind: Optional[SensorKind] = None):
         super().__init__(id_, 0, name, 0, "", kind)
@@ -504,6 +680,8 @@ class EnumCalculated(Sensor):
 class EcoMode(ABC):
     """Sensor representing Eco Mode Battery Power Group API"""
 
+    __slots__ = ()
+
     @abstractmethod
     def encode_charge(self, eco_mode_power: int, eco_mode_soc: int = 100) -> bytes:
         """Answer bytes representing all the time enabled charging eco-mode group"""
@@ -544,6 +722,8 @@ class EcoMode(ABC):
 class EcoModeV1(Sensor, EcoMode):
     """Sensor representing Eco Mode Battery Power Group encoded in 8 bytes"""
 
+    __slots__ = ('start_h', 'start_m', 'end_h', 'end_m', 'power', 'on_off', 'day_bits', 'days', 'soc')
+
     def __init__(self, id_: str, offset: int, name: str):
         super().__init__(id_, offset, name, 8, "", SensorKind.BAT)
         self.start_h: int | None = None
@@ -601,7 +781,7 @@ class EcoModeV1(Sensor, EcoMode):
 
     def encode_off(self) -> bytes:
         """Answer bytes representing empty and disabled eco-mode group"""
-        return bytes.fromhex("3000300000640000")
+        return _ECO_MODE_V1_OFF
 
     def is_eco_charge_mode(self) -> bool:
         """Answer if it represents the emulated 24/7 full-time discharge mode"""
@@ -657,6 +837,9 @@ class EcoModeV1(Sensor, EcoMode):
 class Schedule(Sensor, EcoMode):
     """Sensor representing Schedule Group encoded in 12 bytes"""
 
+    __slots__ = ('start_h', 'start_m', 'end_h', 'end_m', 'on_off', 'day_bits', 'days', 'power', 'soc',
+                 'month_bits', 'months', 'schedule_type')
+
     def __init__(self, id_: str, offset: int, name: str, schedule_type: ScheduleType = ScheduleType.ECO_MODE):
         super().__init__(id_, offset, name, 12, "", SensorKind.BAT)
         self.start_h: int | None = None
@@ -794,6 +977,8 @@ class Schedule(Sensor, EcoMode):
 class EcoModeV2(Schedule):
     """Sensor representing Eco Mode Group encoded in 12 bytes"""
 
+    __slots__ = ()
+
     def __init__(self, id_: str, offset: int, name: str):
         super().__init__(id_, offset, name, ScheduleType.ECO_MODE)
 
@@ -801,6 +986,8 @@ class EcoModeV2(Schedule):
 class PeakShavingMode(Schedule):
     """Sensor representing Peak Shaving Mode encoded in 12 bytes"""
 
+    __slots__ = ()
+
     def __init__(self, id_: str, offset: int, name: str):
         super().__init__(id_, offset, name, ScheduleType.PEAK_SHAVING)
 
@@ -808,6 +995,8 @@ class PeakShavingMode(Schedule):
 class Calculated(Sensor):
     """Sensor representing calculated value"""
 
+    __slots__ = ('_getter',)
+
     def __init__(self, id_: str, getter: Callable[[ProtocolResponse], Any], name: str, unit: str,
                  kind: Optional[SensorKind] = None):
         super().__init__(id_, 0, name, 0, unit, kind)
@@ -820,18 +1009,39 @@ class Calculated(Sensor):
         return self._getter(data)
 
 
+def _unpack(fmt: Struct, data: bytes) -> int:
+    """Unpack the (single integer) value from data, data cut short by the end of response is decoded as is"""
+    if len(data) != fmt.size:
+        # signed formats are the lower case ones ('b', 'h', 'i', 'q')
+        return int.from_bytes(data, byteorder="big", signed=fmt.format[-1].islower())
+    return fmt.unpack(data)[0]
+
+
+def read_struct(buffer: ProtocolResponse, fmt: Struct, offset: int = None) -> tuple:
+    """
+    Retrieve values of (pre-compiled) struct format from buffer, bytes missing beyond the end are read as zeros.
+    Mind the trailing zero padding matches the single value readers only for struct of single byte fields.
+    """
+    if offset is not None:
+        buffer.seek(offset)
+    data = buffer.read(fmt.size)
+    if len(data) != fmt.size:
+        data = data.ljust(fmt.size, b'\x00')
+    return fmt.unpack(data)
+
+
 def read_byte(buffer: ProtocolResponse, offset: int = None) -> int:
     """Retrieve single byte (signed int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    return int.from_bytes(buffer.read(1), byteorder="big", signed=True)
+    return _unpack(_INT8, buffer.read(1))
 
 
 def read_bytes2(buffer: ProtocolResponse, offset: int = None, undef: int = None) -> int:
     """Retrieve 2 byte (unsigned int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=False)
+    value = _unpack(_UINT16, buffer.read(2))
     return undef if value == 0xffff else value
 
 
@@ -839,14 +1049,14 @@ def read_bytes2_signed(buffer: ProtocolResponse, offset: int = None) -> int:
     """Retrieve 2 byte (signed int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    return int.from_bytes(buffer.read(2), byteorder="big", signed=True)
+    return _unpack(_INT16, buffer.read(2))
 
 
 def read_bytes4(buffer: ProtocolResponse, offset: int = None, undef: int = None) -> int:
     """Retrieve 4 byte (unsigned int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(4), byteorder="big", signed=False)
+    value = _unpack(_UINT32, buffer.read(4))
     return undef if value == 0xffffffff else value
 
 
@@ -854,14 +1064,14 @@ def read_bytes4_signed(buffer: ProtocolResponse, offset: int = None) -> int:
     """Retrieve 4 byte (signed int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    return int.from_bytes(buffer.read(4), byteorder="big", signed=True)
+    return _unpack(_INT32, buffer.read(4))
 
 
 def read_bytes8(buffer: ProtocolResponse, offset: int = None, undef: int = None) -> int:
     """Retrieve 8 byte (unsigned int) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(8), byteorder="big", signed=False)
+    value = _unpack(_UINT64, buffer.read(8))
     return undef if value == 0xffffffffffffffff else value
 
 
@@ -869,7 +1079,7 @@ def read_decimal2(buffer: ProtocolResponse, scale: int, offset: int = None) -> f
     """Retrieve 2 byte (signed float) value from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    return float(int.from_bytes(buffer.read(2), byteorder="big", signed=True)) / scale
+    return float(_unpack(_INT16, buffer.read(2))) / scale
 
 
 def read_float4(buffer: ProtocolResponse, offset: int = None) -> float:
@@ -878,7 +1088,7 @@ def read_float4(buffer: ProtocolResponse, offset: int = None) -> float:
         buffer.seek(offset)
     data = buffer.read(4)
     if len(data) == 4:
-        return unpack('>f', data)[0]
+        return _FLOAT32.unpack(data)[0]
     return float(0)
 
 
@@ -886,10 +1096,22 @@ def read_voltage(buffer: ProtocolResponse, offset: int = None) -> float:
     """Retrieve voltage [V] value (2 unsigned bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=False)
+    value = _unpack(_UINT16, buffer.read(2))
     return float(value) / 10 if value != 0xffff else 0
 
 
+def read_vi_power(buffer: ProtocolResponse, offset: int = None) -> int:
+    """Retrieve power [W] calculated from adjacent voltage and current values (2+2 unsigned bytes) in buffer"""
+    if offset is not None:
+        buffer.seek(offset)
+    values = buffer.unpack(_VOLTAGE_CURRENT)
+    if values is None:
+        # truncated response, read the values one by one (as zero padded)
+        return round(read_voltage(buffer) * read_current(buffer))
+    voltage, current = values
+    return round((float(voltage) / 10 if voltage != 0xffff else 0) * (float(current) / 10 if current != 0xffff else 0))
+
+
 def encode_voltage(value: Any) -> bytes:
     """Encode voltage value to raw (2 unsigned bytes) payload"""
     return int.to_bytes(int(float(value) * 10), length=2, byteorder="big", signed=False)
@@ -899,7 +1121,7 @@ def read_current(buffer: ProtocolResponse, offset: int = None) -> float:
     """Retrieve current [A] value (2 unsigned bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=False)
+    value = _unpack(_UINT16, buffer.read(2))
     return float(value) / 10 if value != 0xffff else 0
 
 
@@ -907,7 +1129,7 @@ def read_current_signed(buffer: ProtocolResponse, offset: int = None) -> float:
     """Retrieve current [A] value (2 signed bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=True)
+    value = _unpack(_INT16, buffer.read(2))
     return float(value) / 10
 
 
@@ -925,7 +1147,7 @@ def read_freq(buffer: ProtocolResponse, offset: int = None) -> float:
     """Retrieve frequency [Hz] value (2 bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=True)
+    value = _unpack(_INT16, buffer.read(2))
     return float(value) / 100
 
 
@@ -933,7 +1155,7 @@ def read_temp(buffer: ProtocolResponse, offset: int = None) -> float | None:
     """Retrieve temperature [C] value (2 bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    value = int.from_bytes(buffer.read(2), byteorder="big", signed=True)
+    value = _unpack(_INT16, buffer.read(2))
     if value == -1 or value == 32767:
         return None
     return float(value) / 10
@@ -943,13 +1165,8 @@ def read_datetime(buffer: ProtocolResponse, offset: int = None) -> datetime:
     """Retrieve datetime value (6 bytes) from buffer"""
     if offset is not None:
         buffer.seek(offset)
-    year = 2000 + int.from_bytes(buffer.read(1), byteorder='big')
-    month = int.from_bytes(buffer.read(1), byteorder='big')
-    day = int.from_bytes(buffer.read(1), byteorder='big')
-    hour = int.from_bytes(buffer.read(1), byteorder='big')
-    minute = int.from_bytes(buffer.read(1), byteorder='big')
-    second = int.from_bytes(buffer.read(1), byteorder='big')
-    return datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
+    year, month, day, hour, minute, second = read_struct(buffer, _DATETIME)
+    return datetime(year=2000 + year, month=month, day=day, hour=hour, minute=minute, second=second)
 
 
 def encode_datetime(value: Any) -> bytes:
@@ -985,13 +1202,24 @@ def read_unsigned_int(data: bytes, offset: int) -> int:
 
 
 def decode_bitmap(value: int, bitmap: dict[int, str]) -> str:
-    bits = value
+    return _decode_bits(value, _bit_labels(bitmap))
+
+
+def _bit_labels(bitmap: dict[int, str]) -> tuple[str, ...]:
+    """Labels of (32) bitmap bits indexed by bit position"""
+    return tuple(bitmap.get(i, f'err{i}') for i in range(32))
+
+
+def _decode_bits(value: int, labels: tuple[str, ...]) -> str:
+    bits = value & 0xFFFFFFFF
     result = []
-    for i in range(32):
-        if bits & 0x1 == 1:
-            if bitmap.get(i, f'err{i}'):
-                result.append(bitmap.get(i, f'err{i}'))
-        bits = bits >> 1
+    # visit only the set bits (lowest first), no errors/warnings is the usual case
+    while bits:
+        lowest = bits & -bits
+        label = labels[lowest.bit_length() - 1]
+        if label:
+            result.append(label)
+        bits ^= lowest
     return ", ".join(result)
 
 
@@ -0,0 +1,242 @@
+import asyncio
+from unittest import TestCase, mock
+
+import goodwe
+from goodwe import DT, ES, ET, InverterError
+from goodwe.exceptions import RequestFailedException
+from goodwe.protocol import ProtocolCommand, ProtocolResponse
+
+
+class TestDiscoveryCache(TestCase):
+
+    def setUp(self) -> None:
+        goodwe.clear_discovery_cache()
+        self.addCleanup(goodwe.clear_discovery_cache)
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    @mock.patch.object(ET, 'read_device_info', new_callable=mock.AsyncMock)
+    @mock.patch('goodwe._discover', new_callable=mock.AsyncMock)
+    def test_cache_hit(self, mock_discover, mock_read_device_info):
+        mock_discover.return_value = ET('127.0.0.1', 8899)
+        self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+        inverter = self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+
+        self.assertIsInstance(inverter, ET)
+        mock_discover.assert_called_once()
+        mock_read_device_info.assert_called_once()
+
+    @mock.patch.object(ET, 'read_device_info', new_callable=mock.AsyncMock)
+    @mock.patch('goodwe._discover', new_callable=mock.AsyncMock)
+    def test_cache_other_host(self, mock_discover, mock_read_device_info):
+        mock_discover.return_value = ET('127.0.0.1', 8899)
+        self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+        self.loop.run_until_complete(goodwe.discover('127.0.0.2'))
+
+        self.assertEqual(2, mock_discover.call_count)
+        mock_read_device_info.assert_not_called()
+
+    @mock.patch('goodwe.time.monotonic')
+    @mock.patch.object(ET, 'read_device_info', new_callable=mock.AsyncMock)
+    @mock.patch('goodwe._discover', new_callable=mock.AsyncMock)
+    def test_cache_expired(self, mock_discover, mock_read_device_info, mock_monotonic):
+        mock_discover.return_value = ET('127.0.0.1', 8899)
+        mock_monotonic.return_value = 1000
+        self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+        mock_monotonic.return_value = 1000 + goodwe._DISCOVERY_CACHE_TTL
+        self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+
+        self.assertEqual(2, mock_discover.call_count)
+        mock_read_device_info.assert_not_called()
+
+    @mock.patch('goodwe._discover', new_callable=mock.AsyncMock)
+    def test_failed_discovery_not_cached(self, mock_discover):
+        mock_discover.side_effect = InverterError('No response')
+        self.assertRaises(InverterError, self.loop.run_until_complete, goodwe.discover('127.0.0.1'))
+        self.assertRaises(InverterError, self.loop.run_until_complete, goodwe.discover('127.0.0.1'))
+
+        self.assertEqual(2, mock_discover.call_count)
+        self.assertFalse(goodwe._DISCOVERY_CACHE)
+
+    @mock.patch.object(ET, 'read_device_info', new_callable=mock.AsyncMock)
+    @mock.patch('goodwe._discover', new_callable=mock.AsyncMock)
+    def test_cached_inverter_not_responding(self, mock_discover, mock_read_device_info):
+        mock_discover.side_effect = [ET('127.0.0.1', 8899), DT('127.0.0.1', 8899)]
+        mock_read_device_info.side_effect = InverterError('No response')
+        self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+        inverter = self.loop.run_until_complete(goodwe.discover('127.0.0.1'))
+
+        self.assertIsInstance(inverter, DT)
+        self.assertEqual(2, mock_discover.call_count)
+        self.assertIs(DT, goodwe._DISCOVERY_CACHE[('127.0.0.1', 8899)][1])
+
+    def test_clear_discovery_cache(self):
+        goodwe._DISCOVERY_CACHE[('127.0.0.1', 8899)] = (0, ET)
+        goodwe.clear_discovery_cache()
+        self.assertFalse(goodwe._DISCOVERY_CACHE)
+
+
+class TestDiscover(TestCase):
+
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.started = []
+        self.cancelled = []
+
+    def _probe(self, result, delay: float = 0):
+        """Create mock probe answering the result (or raising it) after delay, recording its start and cancellation"""
+
+        async def probe(*args):
+            self.started.append(result)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(result)
+                raise
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return probe
+
+    def _patch_probes(self, aa55, et, dt, es) -> None:
+        probes = {ET: et, DT: dt, ES: es}
+
+        async def probe(inv, *args):
+            return await probes[inv](inv, *args)
+
+        aa55_patcher = mock.patch('goodwe._probe_aa55', side_effect=aa55)
+        probe_patcher = mock.patch('goodwe._probe', side_effect=probe)
+        aa55_patcher.start()
+        probe_patcher.start()
+        self.addCleanup(aa55_patcher.stop)
+        self.addCleanup(probe_patcher.stop)
+
+    def test_aa55_wins(self):
+        self._patch_probes(self._probe('aa55'), self._probe('et'), self._probe('dt'), self._probe('es'))
+        result = self.loop.run_until_complete(goodwe._discover('127.0.0.1', 8899, 0.01, 0))
+
+        self.assertEqual('aa55', result)
+        self.assertEqual(['aa55'], self.started)
+
+    def test_aa55_skipped_on_tcp(self):
+        self._patch_probes(self._probe('aa55'), self._probe('et'), self._probe('dt'), self._probe('es'))
+        result = self.loop.run_until_complete(goodwe._discover('127.0.0.1', 502, 0.01, 0))
+
+        self.assertEqual('et', result)
+        self.assertEqual(['et'], self.started)
+
+    def test_family_probe_after_aa55_failure(self):
+        self._patch_probes(self._probe(InverterError('aa55')), self._probe(InverterError('et')),
+                           self._probe('dt'), self._probe('es'))
+        result = self.loop.run_until_complete(goodwe._discover('127.0.0.1', 8899, 0.01, 0))
+
+        self.assertEqual('dt', result)
+        self.assertEqual(3, len(self.started))
+        self.assertFalse(self.cancelled)
+
+    def test_probes_staggered_and_losers_cancelled(self):
+        # AA55 answers late (after ET probe was started), ET never answers
+        self._patch_probes(self._probe('aa55', 0.05), self._probe('et', 10), self._probe('dt'), self._probe('es'))
+        result = self.loop.run_until_complete(goodwe._discover('127.0.0.1', 8899, 0.02, 0))
+
+        self.assertEqual('aa55', result)
+        self.assertEqual('aa55', self.started[0])
+        self.assertNotIn('es', self.started)
+        self.assertIn('et', self.cancelled)
+        self.assertNotIn('aa55', self.cancelled)
+
+    def test_preferred_probe_wins(self):
+        # AA55 answers after DT probe, yet it is still preferred
+        self._patch_probes(self._probe('aa55', 0.05), self._probe(InverterError('et')), self._probe('dt'),
+                           self._probe('es'))
+        result = self.loop.run_until_complete(goodwe._discover('127.0.0.1', 8899, 0.02, 0))
+
+        self.assertEqual('aa55', result)
+        self.assertNotIn('es', self.started)
+
+    def test_all_failed(self):
+        self._patch_probes(self._probe(InverterError('aa55')), self._probe(InverterError('et')),
+                           self._probe(InverterError('dt')), self._probe(InverterError('es')))
+        with self.assertRaises(InverterError) as ctx:
+            self.loop.run_until_complete(goodwe._discover('127.0.0.1', 8899, 0.01, 0))
+
+        self.assertIn('Unable to connect to the inverter', str(ctx.exception))
+        self.assertEqual(4, len(self.started))
+
+
+class TestProbeAa55(TestCase):
+
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def _mock_discovery_response(self, model_name: str, serial_number: str) -> None:
+        data = bytes(5) + model_name.encode('ascii').ljust(10) + bytes(16) + serial_number.encode('ascii') + bytes(20)
+        patcher = mock.patch.object(goodwe.DISCOVERY_COMMAND, 'execute', new_callable=mock.AsyncMock,
+                                    return_value=ProtocolResponse(data, None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch.object(ET, 'read_device_info', new_callable=mock.AsyncMock)
+    def test_probe_et(self, mock_read_device_info):
+        self._mock_discovery_response('GW10K-ET', '9010KETU000W0000')
+        inverter = self.loop.run_until_complete(goodwe._probe_aa55('127.0.0.1', 8899, 1, 0))
+
+        self.assertIsInstance(inverter, ET)
+        mock_read_device_info.assert_called_once()
+
+    @mock.patch.object(DT, 'read_device_info', new_callable=mock.AsyncMock)
+    def test_probe_dt(self, mock_read_device_info):
+        self._mock_discovery_response('GW6000-DT', '56000DTU000W0000')
+        inverter = self.loop.run_until_complete(goodwe._probe_aa55('127.0.0.1', 8899, 1, 0))
+
+        self.assertIsInstance(inverter, DT)
+        mock_read_device_info.assert_called_once()
+
+    def test_probe_unrecognised(self):
+        self._mock_discovery_response('GW1000-XX', '51000XXX000W0000')
+        self.assertRaises(InverterError, self.loop.run_until_complete,
+                          goodwe._probe_aa55('127.0.0.1', 8899, 1, 0))
+
+    def test_probe_short_response(self):
+        patcher = mock.patch.object(goodwe.DISCOVERY_COMMAND, 'execute', new_callable=mock.AsyncMock,
+                                    return_value=ProtocolResponse(bytes(20), None))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assertRaises(InverterError, self.loop.run_until_complete,
+                          goodwe._probe_aa55('127.0.0.1', 8899, 1, 0))
+
+
+class TestSearchInverters(TestCase):
+
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    @mock.patch.object(ProtocolCommand, 'execute', new_callable=mock.AsyncMock)
+    def test_search_inverters(self, mock_execute):
+        mock_execute.return_value = ProtocolResponse(b'192.168.1.12,5C:00:00:00:00:00,Solar-WiFi', None)
+        result = self.loop.run_until_complete(goodwe.search_inverters())
+
+        self.assertEqual(b'192.168.1.12,5C:00:00:00:00:00,Solar-WiFi', result)
+
+    @mock.patch.object(ProtocolCommand, 'execute', new_callable=mock.AsyncMock)
+    def test_search_inverters_no_response(self, mock_execute):
+        mock_execute.side_effect = RequestFailedException('No valid response received even after 3 retries', 1)
+        with self.assertRaises(InverterError) as ctx:
+            self.loop.run_until_complete(goodwe.search_inverters())
+
+        self.assertEqual('No valid response received to broadcast request.', str(ctx.exception))
+
+    @mock.patch.object(ProtocolCommand, 'execute', new_callable=mock.AsyncMock)
+    def test_search_inverters_cancelled(self, mock_execute):
+        async def execute(*args):
+            await asyncio.sleep(10)
+
+        mock_execute.side_effect = execute
+
+        # cancellation of caller's task is not turned into an InverterError
+        self.assertRaises(asyncio.TimeoutError, self.loop.run_until_complete,
+                          asyncio.wait_for(goodwe.search_inverters(), 0.01))
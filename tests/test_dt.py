@@ -4,7 +4,7 @@ from datetime import datetime
 from unittest import TestCase
 
 from goodwe.dt import DT
-from goodwe.exceptions import RequestFailedException, RequestRejectedException
+from goodwe.exceptions import IllegalDataAddressException, RequestFailedException
 from goodwe.modbus import ILLEGAL_DATA_ADDRESS
 from goodwe.protocol import ProtocolCommand, ProtocolResponse
 
@@ -28,7 +28,7 @@ class DtMock(TestCase, DT):
         filename = self._mock_responses.get(command)
         if filename is not None:
             if ILLEGAL_DATA_ADDRESS == filename:
-                raise RequestRejectedException(ILLEGAL_DATA_ADDRESS)
+                raise IllegalDataAddressException(ILLEGAL_DATA_ADDRESS)
             if 'NO RESPONSE' == filename:
                 raise RequestFailedException()
             with open(root_dir + '/sample/dt/' + filename, 'r') as f:
@@ -148,6 +148,32 @@ class GW8K_DT_Test(DtMock):
         self.assertEqual(49, self.arm_svn_version)
         self.assertEqual('1010.1010.08', self.firmware)
 
+    def test_GW8K_DT_device_info_sensors_variant(self):
+        self.loop.run_until_complete(self.read_device_info())
+        sensors = self._sensors
+        self.loop.run_until_complete(self.read_device_info())
+        self.assertIs(sensors, self._sensors)
+        self.assertNotIn('ppv3', {s.id_ for s in sensors})
+
+    def test_GW8K_DT_sensors(self):
+        self.loop.run_until_complete(self.read_device_info())
+        sensors = self.sensors()
+        self.assertIs(sensors, self.sensors())
+        self.assertEqual(len(self._sensors) + len(self._sensors_meter), len(sensors))
+
+        self.loop.run_until_complete(self.read_runtime_data())
+        self.assertIs(self._sensors, self.sensors())
+
+    def test_GW8K_DT_read_settings_data(self):
+        self.loop.run_until_complete(self.read_device_info())
+        data = self.loop.run_until_complete(self.read_settings_data())
+        self.assertEqual([s.id_ for s in self.settings()], list(data))
+
+    def test_GW8K_DT_decode_plan(self):
+        self.loop.run_until_complete(self.read_device_info())
+        response = self.loop.run_until_complete(self._read_from_socket(self._READ_RUNNING_DATA))
+        self.assertEqual(self._map_response(response, self._sensors), self._decode_response(response, self._sensors))
+
     def test_GW8K_DT_runtime_data(self):
         self.loop.run_until_complete(self.read_device_info())
         data = self.loop.run_until_complete(self.read_runtime_data())
@@ -65,6 +65,7 @@ class GW5048D_ES_Test(EsMock):
         self.assertEqual(23, self.dsp1_version)
         self.assertEqual(23, self.dsp2_version)
         self.assertEqual(16, self.arm_version)
+        self.assertTrue(self._has_eco_mode_v2)
 
     def test_GW5048D_ES_runtime_data(self):
         data = self.loop.run_until_complete(self.read_runtime_data())
@@ -195,6 +196,7 @@ class GW5048_EM_Test(EsMock):
         self.assertEqual(11, self.arm_version)
 
         self.assertFalse(self._supports_eco_mode_v2())
+        self.assertFalse(self._has_eco_mode_v2)
 
     def test_GW5048_EM_runtime_data(self):
         data = self.loop.run_until_complete(self.read_runtime_data())
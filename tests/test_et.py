@@ -4,7 +4,7 @@ from datetime import datetime
 from unittest import TestCase
 
 from goodwe.et import ET
-from goodwe.exceptions import RequestRejectedException, RequestFailedException
+from goodwe.exceptions import IllegalDataAddressException, RequestFailedException
 from goodwe.inverter import OperationMode
 from goodwe.modbus import ILLEGAL_DATA_ADDRESS
 from goodwe.protocol import ModbusRtuReadCommand, ProtocolCommand, ProtocolResponse
@@ -28,7 +28,7 @@ class EtMock(TestCase, ET):
         filename = self._mock_responses.get(command)
         if filename is not None:
             if ILLEGAL_DATA_ADDRESS == filename:
-                raise RequestRejectedException(ILLEGAL_DATA_ADDRESS)
+                raise IllegalDataAddressException(ILLEGAL_DATA_ADDRESS)
             if 'NO RESPONSE' == filename:
                 raise RequestFailedException()
             with open(root_dir + '/sample/et/' + filename, 'r') as f:
@@ -79,6 +79,14 @@ class GW10K_ET_Test(EtMock):
         self.assertEqual('04029-06-S11', self.firmware)
         self.assertEqual('02041-17-S00', self.arm_firmware)
 
+    def test_GW10K_ET_device_info_sensors_variant(self):
+        self.loop.run_until_complete(self.read_device_info())
+        sensors, sensors_meter = self._sensors, self._sensors_meter
+        self.loop.run_until_complete(self.read_device_info())
+        self.assertIs(sensors, self._sensors)
+        self.assertIs(sensors_meter, self._sensors_meter)
+        self.assertNotIn('ppv3', {s.id_ for s in sensors})
+
     def test_GW10K_ET_runtime_data(self):
         # Reset sensors
         self.loop.run_until_complete(self.read_device_info())
@@ -260,6 +268,16 @@ class GW10K_ET_Test(EtMock):
 
         self.loop.run_until_complete(self.read_setting('modbus_47000'))
         self.assertEqual('f703b798000136c7', self.request.hex())
+        self.assertIs(self._read_command(47000, 1), self._read_command(47000, 1))
+
+    def test_GW10K_ET_read_settings_data(self):
+        self.mock_response(ModbusRtuReadCommand(0xf7, 47000, 1), ILLEGAL_DATA_ADDRESS)
+        settings = self.settings()
+        self.assertIs(settings, self.settings())
+        data = self.loop.run_until_complete(self.read_settings_data())
+        self.assertEqual([s.id_ for s in settings], list(data))
+        self.assertIsNone(data.get('work_mode'))
+        self.assertEqual(67, len(self.settings()))
 
     def test_GW10K_ET_write_setting(self):
         self.loop.run_until_complete(self.write_setting('grid_export_limit', 100))
@@ -271,6 +289,12 @@ class GW10K_ET_Test(EtMock):
         self.loop.run_until_complete(self.write_setting('time', datetime(2022, 1, 4, 18, 30, 25)))
         self.assertEqual('f710b090000306160104121e19a961', self.request.hex())
 
+    def test_GW10K_ET_write_byte_setting(self):
+        self.loop.run_until_complete(self.write_setting('eco_mode_2_switch', 0))
+        self.loop.run_until_complete(self.write_setting('eco_mode_2_switch', -1))
+        self.assertEqual(['f703b9a200011422', 'f706b9a2000359e3', 'f706b9a2ff031813'],
+                         [r.hex() for r in self._list_of_requests])
+
     def test_get_grid_export_limit(self):
         self.loop.run_until_complete(self.get_grid_export_limit())
         self.assertEqual('f703b996000155ec', self.request.hex())
@@ -295,10 +319,25 @@ class GW10K_ET_Test(EtMock):
     #        self.loop.run_until_complete(self.set_operation_mode(1))
     #        self.assertEqual('f706b7980001fac7', self.request.hex())
 
+    def test_get_operation_mode_not_eco(self):
+        self.mock_response(ModbusRtuReadCommand(0xf7, 47000, 1), 'work_mode_backup.hex')
+        self.mock_response(ModbusRtuReadCommand(0xf7, 47515, 4), 'NO RESPONSE')
+        self.assertEqual(OperationMode.BACKUP, self.loop.run_until_complete(self.get_operation_mode()))
+
+    def test_get_operation_mode_cached(self):
+        self.mock_response(ModbusRtuReadCommand(0xf7, 47000, 1), 'work_mode_backup.hex')
+        self.assertEqual(OperationMode.BACKUP, self.loop.run_until_complete(self.get_operation_mode()))
+        self.mock_response(ModbusRtuReadCommand(0xf7, 47000, 1), 'NO RESPONSE')
+        self.assertEqual(OperationMode.BACKUP, self.loop.run_until_complete(self.get_operation_mode()))
+        self.loop.run_until_complete(self.write_setting('modbus_47000', 2))
+        self.assertRaises(RequestFailedException, lambda: self.loop.run_until_complete(self.get_operation_mode()))
+
     def test_set_operation_mode_ECO_CHARGE(self):
         self.loop.run_until_complete(self.read_device_info())
         self.loop.run_until_complete(self.set_operation_mode(OperationMode.ECO_CHARGE, eco_mode_power=40))
         self.assertEqual('f710b99b0004080000173bffd8ff7f1343', self._list_of_requests[-9].hex())
+        self.assertEqual(['f706b9a2000359e3', 'f706b9a600031822', 'f706b9aa0003d821'],
+                         [r.hex() for r in self._list_of_requests[-7:-2:2]])
         self.loop.run_until_complete(
             self.set_operation_mode(OperationMode.ECO_CHARGE, eco_mode_power=40, eco_mode_soc=80))
         self.assertEqual('f710b99b0004080000173bffd8ff7f1343', self._list_of_requests[-9].hex())
@@ -350,6 +389,8 @@ class GW10K_ET_fw819_Test(EtMock):
         self.loop.run_until_complete(
             self.set_operation_mode(OperationMode.ECO_CHARGE, eco_mode_power=40, eco_mode_soc=80))
         self.assertEqual('f710b9bb00060c0000173bff7fffd80050000002cc', self._list_of_requests[-9].hex())
+        self.assertEqual(['f706b9c30003083d', 'f706b9c90003283f', 'f706b9cf0003c83e'],
+                         [r.hex() for r in self._list_of_requests[-7:-2:2]])
         self.loop.run_until_complete(
             self.set_operation_mode(OperationMode.ECO_CHARGE, eco_mode_power=40))
         self.assertEqual('f710b9bb00060c0000173bff7fffd8006400004302', self._list_of_requests[-9].hex())
@@ -1226,7 +1267,7 @@ class GW29K9_ET_Test(EtMock):
         self.assertSensor('battery2_warning_l', 0, '', data)
         self.assertSensor('battery2_protocol', 288, '', data)
         self.assertSensor('battery2_error_h', 0, '', data)
-        self.assertSensor('battery2_error', '', '', data)
+        self.assertSensor('battery2_error', 'Communication failure 2', '', data)
         self.assertSensor('battery2_warning_h', 0, '', data)
         self.assertSensor('battery2_warning', '', '', data)
         self.assertSensor('battery2_sw_version', 0, '', data)
@@ -1290,6 +1331,41 @@ class GW29K9_ET_Test(EtMock):
 
         self.assertFalse(self.sensor_map, f"Some sensors were not tested {self.sensor_map}")
 
+    def test_GW29K9_ET_runtime_data_mppt_not_supported(self):
+        self.loop.run_until_complete(self.read_device_info())
+        self.mock_response(self._READ_MPPT_DATA, ILLEGAL_DATA_ADDRESS)
+
+        data = self.loop.run_until_complete(self.read_runtime_data())
+        self.assertFalse(self._has_mppt)
+        self.assertIsNone(data.get('pmppt1'))
+        self.assertEqual(0, data.get('battery2_soc'))
+        self.assertEqual(-4077, data.get('meter_active_power_total'))
+
+    def test_GW29K9_ET_runtime_data_battery2_failure(self):
+        self.loop.run_until_complete(self.read_device_info())
+        self.mock_response(self._READ_BATTERY2_INFO, 'NO RESPONSE')
+
+        self.assertRaises(RequestFailedException, self.loop.run_until_complete, self.read_runtime_data())
+        self.assertTrue(self._has_battery2)
+        self.assertTrue(self._has_mppt)
+
+    def test_GW29K9_ET_sensors(self):
+        self.loop.run_until_complete(self.read_device_info())
+        sensors = self.sensors()
+        self.assertIs(sensors, self.sensors())
+        self.assertIn('pmppt1', {s.id_ for s in sensors})
+
+        self._has_mppt = False
+        self.assertNotIn('pmppt1', {s.id_ for s in self.sensors()})
+
+    def test_GW29K9_ET_decode_plan(self):
+        self.loop.run_until_complete(self.read_device_info())
+        for command, sensors in ((self._READ_RUNNING_DATA, self._sensors),
+                                 (self._READ_BATTERY_INFO, self._sensors_battery),
+                                 (self._READ_MPPT_DATA, self._sensors_mppt)):
+            response = self.loop.run_until_complete(self._read_from_socket(command))
+            self.assertEqual(self._map_response(response, sensors), self._decode_response(response, sensors))
+
 
 class GW5K_BT_Test(EtMock):
 
@@ -44,6 +44,8 @@ class TestModbus(TestCase):
         self.assert_rtu_response_fail('aa55f70304010203043346', 0x03, 0x0401, 2)
         # failure code
         self.assert_rtu_response_rejected('aa55f783040102030405b35e', 0x03, 0x0401, 2)
+        self.assertRaises(IllegalDataAddressException,
+                          lambda: validate_modbus_rtu_response(bytes.fromhex('aa55f7830220c3'), 0x03, 0x0401, 2))
         # unexpected message length
         self.assert_rtu_response_fail('aa55f70306010203040506b417', 0x03, 0x0401, 2)
 
@@ -110,6 +112,8 @@ class TestModbus(TestCase):
         self.assert_tcp_response_partial('000100000007b403040000', 0x03, 331, 2)
         # failure code
         self.assert_tcp_response_rejected('000100000007b4830400000002', 0x03, 331, 2)
+        self.assertRaises(IllegalDataAddressException,
+                          lambda: validate_modbus_tcp_response(bytes.fromhex('000100000003b48302'), 0x03, 331, 2))
 
     def test_validate_modbus_tcp_write_response(self):
         self.assert_tcp_response_ok('000100000006b40601364556', 0x06, 310, 0x4556)
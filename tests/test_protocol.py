@@ -1,3 +1,4 @@
+import asyncio
 from unittest import TestCase, mock
 
 from goodwe.protocol import *
@@ -64,6 +65,157 @@ class TestUDPClientProtocol(TestCase):
         # self.protocol._transport.close.assert_called()
         self.protocol._send_request.assert_not_called()
 
+    async def _cancel_request(self) -> None:
+        self.protocol._ensure_lock()
+        transport = mock.Mock()
+        transport.is_closing.return_value = False
+        self.protocol._transport = transport
+        request = asyncio.ensure_future(self.protocol.send_request(self.protocol.command))
+        await asyncio.sleep(0)
+        request.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await request
+        self.assertFalse(self.protocol._lock.locked())
+        self.assertEqual(0, self.protocol._retry)
+        transport.sendto.assert_called_once()
+
+    def test_send_request_cancelled(self):
+        asyncio.run(self._cancel_request())
+
+    async def _cancel_execute(self) -> None:
+        self.protocol._ensure_lock()
+        transport = mock.Mock()
+        transport.is_closing.return_value = False
+        self.protocol._transport = transport
+        request = asyncio.ensure_future(self.protocol.command.execute(self.protocol))
+        await asyncio.sleep(0)
+        request.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await request
+        self.assertFalse(self.protocol._lock.locked())
+        transport.sendto.assert_called_once()
+        transport.close.assert_called_once()
+
+    def test_execute_cancelled(self):
+        asyncio.run(self._cancel_execute())
+
+    async def _retry_request(self) -> list[mock.Mock]:
+        transports = []
+
+        async def connect():
+            if not self.protocol._transport:
+                self.protocol._transport = mock.Mock()
+                self.protocol._transport.is_closing.return_value = False
+                transports.append(self.protocol._transport)
+
+        self.protocol._connect = connect
+        self.protocol.keep_alive = True
+        request = asyncio.ensure_future(self.protocol.send_request(self.protocol.command))
+        await asyncio.sleep(0)
+        self.protocol._timeout_mechanism()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.protocol.datagram_received(b'late or retried response', ('127.0.0.1', 1337))
+        await request
+        return transports
+
+    def test_send_request_retry_new_socket(self):
+        transports = asyncio.run(self._retry_request())
+        self.assertEqual(2, len(transports))
+        transports[0].close.assert_called_once()
+        transports[0].sendto.assert_called_once()
+        transports[1].sendto.assert_called_once()
+        transports[1].close.assert_not_called()
+
+    async def _run_session(self, transport: mock.Mock) -> None:
+        async with self.protocol.session():
+            self.assertTrue(self.protocol._keep_connection())
+            self.protocol._transport = transport
+
+    def test_session(self):
+        transport = mock.Mock()
+        asyncio.run(self._run_session(transport))
+        self.assertFalse(self.protocol._keep_connection())
+        transport.close.assert_called_once()
+
+    async def _run_nested_session(self, transport: mock.Mock) -> None:
+        async with self.protocol.session():
+            self.protocol._transport = transport
+            await self._run_session(transport)
+            transport.close.assert_not_called()
+
+    def test_session_nested(self):
+        transport = mock.Mock()
+        asyncio.run(self._run_nested_session(transport))
+        self.assertFalse(self.protocol._keep_connection())
+        transport.close.assert_called_once()
+
+    async def _run_session_set_keep_alive(self, transport: mock.Mock) -> None:
+        async with self.protocol.session():
+            self.protocol._transport = transport
+            self.protocol.keep_alive = True
+
+    def test_session_set_keep_alive(self):
+        transport = mock.Mock()
+        asyncio.run(self._run_session_set_keep_alive(transport))
+        self.assertTrue(self.protocol.keep_alive)
+        transport.close.assert_not_called()
+
+    async def _close_session_during_request(self, transport: mock.Mock) -> None:
+        lock = self.protocol._ensure_lock()
+        self.protocol._transport = transport
+        await lock.acquire()
+        session = asyncio.ensure_future(self._run_session(transport))
+        await asyncio.sleep(0)
+        transport.close.assert_not_called()
+        lock.release()
+        await session
+
+    def test_session_close_waits_for_request(self):
+        transport = mock.Mock()
+        asyncio.run(self._close_session_during_request(transport))
+        transport.close.assert_called_once()
+
+    @mock.patch('goodwe.protocol.asyncio.get_running_loop')
+    def test_connect_broadcast(self, mock_get_event_loop):
+        mock_loop = mock.Mock()
+        mock_loop.create_datagram_endpoint = mock.AsyncMock(return_value=(mock.Mock(), None))
+        mock_get_event_loop.return_value = mock_loop
+
+        asyncio.run(self.protocol._connect())
+        self.assertFalse(mock_loop.create_datagram_endpoint.call_args.kwargs['allow_broadcast'])
+
+        protocol = UdpInverterProtocol(BROADCAST_ADDRESS, 48899, 1, 1, 3)
+        asyncio.run(protocol._connect())
+        self.assertTrue(mock_loop.create_datagram_endpoint.call_args.kwargs['allow_broadcast'])
+
+    @mock.patch('goodwe.protocol.asyncio.get_running_loop')
+    def test_resolve_host(self, mock_get_event_loop):
+        mock_loop = mock.Mock()
+        mock_loop.getaddrinfo = mock.AsyncMock(return_value=[(socket.AF_INET, socket.SOCK_DGRAM, 0, '', ('10.0.0.7', 8899))])
+        mock_get_event_loop.return_value = mock_loop
+
+        self.assertEqual('127.0.0.1', asyncio.run(self.protocol._resolve_host()))
+        mock_loop.getaddrinfo.assert_not_called()
+
+        protocol = UdpInverterProtocol('inverter.local', 8899, 0xf7, 1, 3)
+        self.assertEqual('10.0.0.7', asyncio.run(protocol._resolve_host()))
+        self.assertEqual('10.0.0.7', asyncio.run(protocol._resolve_host()))
+        mock_loop.getaddrinfo.assert_called_once_with('inverter.local', 8899, type=socket.SOCK_DGRAM)
+
+    @mock.patch('goodwe.protocol.asyncio.get_running_loop')
+    def test_resolve_host_connect_failed(self, mock_get_event_loop):
+        mock_loop = mock.Mock()
+        mock_loop.getaddrinfo = mock.AsyncMock(return_value=[(socket.AF_INET, socket.SOCK_DGRAM, 0, '', ('10.0.0.7', 8899))])
+        mock_loop.create_datagram_endpoint = mock.AsyncMock(side_effect=OSError('Network is unreachable'))
+        mock_get_event_loop.return_value = mock_loop
+
+        protocol = UdpInverterProtocol('inverter.local', 8899, 0xf7, 1, 3)
+        self.assertRaises(OSError, asyncio.run, protocol._connect())
+        self.assertRaises(OSError, asyncio.run, protocol._connect())
+        # failed address is not re-used, the host is resolved again
+        self.assertEqual(2, mock_loop.getaddrinfo.call_count)
+
     # @mock.patch('goodwe.protocol.asyncio.get_running_loop')
     # def test_retry_mechanism_two_retries(self, mock_get_event_loop):
     #     def call_later(_: int, retry_func: Callable):
@@ -130,3 +282,61 @@ class TestUDPClientProtocol(TestCase):
     def test_aa55_write_multi_command(self):
         command = Aa55WriteMultiCommand(0x0701, bytes.fromhex('08070605'))
         self.assertEqual(bytes.fromhex('AA55C07F02390B0701040807060502AA'), command.request)
+
+    def test_protocol_response(self):
+        response = ProtocolResponse(bytes.fromhex('aa55f703040102030455aa'), ModbusRtuReadCommand(0xf7, 100, 2))
+        self.assertEqual(bytes.fromhex('01020304'), response.response_data())
+        response.seek(101)
+        self.assertEqual(bytes.fromhex('0304'), response.read(2))
+        self.assertEqual(b'', response.read(2))
+        response.seek(100)
+        self.assertEqual(bytes.fromhex('01'), response.read(1))
+        self.assertEqual(bytes.fromhex('020304'), response.read(4))
+        self.assertRaises(ValueError, response.seek, 99)
+
+
+class TestTCPClientProtocol(TestCase):
+    def setUp(self) -> None:
+        self.protocol = TcpInverterProtocol('127.0.0.1', 502, 0xf7, 1, 3)
+        self.transport = mock.Mock()
+
+    async def _run_session(self) -> None:
+        async with self.protocol.session():
+            self.assertTrue(self.protocol._keep_connection())
+            self.protocol._transport = self.transport
+
+    def test_session(self):
+        asyncio.run(self._run_session())
+        self.assertFalse(self.protocol._keep_connection())
+        self.transport.close.assert_called_once()
+
+    def test_session_keep_alive(self):
+        self.protocol.keep_alive = True
+        asyncio.run(self._run_session())
+        self.assertTrue(self.protocol.keep_alive)
+        self.transport.close.assert_not_called()
+
+    @mock.patch('goodwe.protocol.asyncio.get_running_loop')
+    def test_connect_host_name(self, mock_get_event_loop):
+        mock_loop = mock.Mock()
+        mock_loop.create_connection = mock.AsyncMock(return_value=(mock.Mock(), None))
+        mock_get_event_loop.return_value = mock_loop
+
+        protocol = TcpInverterProtocol('inverter.local', 502, 0xf7, 1, 3)
+        asyncio.run(protocol._connect())
+        # host name is resolved by asyncio, so each of its addresses is tried
+        self.assertEqual('inverter.local', mock_loop.create_connection.call_args.kwargs['host'])
+        mock_loop.getaddrinfo.assert_not_called()
+
+    @mock.patch('goodwe.protocol.asyncio.sleep')
+    def test_send_request_refused_backoff(self, mock_sleep):
+        self.protocol._connect = mock.AsyncMock(side_effect=ConnectionRefusedError)
+        command = ModbusTcpReadCommand(0xf7, 0x88b8, 0x0021)
+        with self.assertRaises(MaxRetriesException):
+            asyncio.run(command.execute(self.protocol))
+        self.assertEqual(4, self.protocol._connect.call_count)
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(3, len(delays))
+        self.assertTrue(0.2 <= delays[0] < 0.25)
+        self.assertTrue(0.4 <= delays[1] < 0.45)
+        self.assertTrue(0.8 <= delays[2] < 0.85)
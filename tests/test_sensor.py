@@ -74,6 +74,15 @@ class TestUtils(TestCase):
         self.assertEqual("ff9e", testee.encode_value(-98).hex())
         self.assertEqual("ff9e", testee.encode_value("-98").hex())
 
+    def test_truncated_response(self):
+        # value cut short by the end of response is decoded from the remaining bytes (and sign extended)
+        self.assertEqual(-1, read_bytes2_signed(MockResponse("ff")))
+        self.assertEqual(255, read_bytes2(MockResponse("ff")))
+        self.assertEqual(-98, read_bytes4_signed(MockResponse("ff9e")))
+        self.assertEqual(65438, read_bytes4(MockResponse("ff9e")))
+        self.assertEqual(-0.1, read_decimal2(MockResponse("ff"), 10))
+        self.assertEqual(0, read_bytes2_signed(MockResponse("")))
+
     def test_decimal(self):
         testee = Decimal("", 0, 10, "", "", None)
 
@@ -122,6 +131,17 @@ class TestUtils(TestCase):
         data = MockResponse("ffff")
         self.assertEqual(0, testee.read(data))
 
+    def test_vi_power(self):
+        data = MockResponse("0cfe0041")
+        self.assertEqual(2162, read_vi_power(data, 0))
+        data = MockResponse("ffff0041")
+        self.assertEqual(0, read_vi_power(data, 0))
+        # truncated response
+        data = MockResponse("0cfe41")
+        self.assertEqual(2162, read_vi_power(data, 0))
+        data = MockResponse("0cfe")
+        self.assertEqual(0, read_vi_power(data, 0))
+
     def test_current_signed(self):
         testee = CurrentS("", 0, "", None)
 